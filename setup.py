@@ -38,6 +38,7 @@ setup(
     ext_modules=cythonize(
         [
             Extension("ampal.geometry", ["src/ampal/geometry.pyx"]),
+            Extension("ampal._pdb_parser_c", ["src/ampal/_pdb_parser_c.pyx"]),
         ]
     ),
     install_requires=["Cython", "networkx==3.1", "numpy==1.22", "requests"],
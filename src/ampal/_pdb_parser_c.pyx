@@ -0,0 +1,149 @@
+"""Compiled parsing of PDB coordinate records.
+
+The numeric columns of ATOM/HETATM records are converted directly from the
+line buffer, rather than by slicing out Python strings and calling `int`
+and `float` on them. Integers are read with a digit loop and floats with
+CPython's locale-independent `PyOS_string_to_double`. Any field that is
+not a plain number is passed to `int` or `float`, so the result, or the
+error raised, is the same as for the pure Python parser.
+"""
+
+#cython: embedsignature=True
+
+from cpython.conversion cimport PyOS_string_to_double
+from libc.string cimport memcpy
+
+import sys
+
+cdef enum:
+    FIELD_BUFFER_SIZE = 32
+    # Longest run of digits that cannot overflow a long
+    MAX_INT_DIGITS = 18
+
+
+cdef bint _is_space(char c):
+    return c == b' ' or c == b'\t' or c == b'\r' or c == b'\n'
+
+
+cdef int _field_to_buffer(
+        const char* line, Py_ssize_t length, Py_ssize_t start, Py_ssize_t end,
+        char* buffer):
+    """Copies a stripped fixed-width field into a null-terminated buffer."""
+    cdef Py_ssize_t size
+    if end > length:
+        end = length
+    while start < end and _is_space(line[start]):
+        start += 1
+    while end > start and _is_space(line[end - 1]):
+        end -= 1
+    size = end - start
+    if size <= 0:
+        buffer[0] = 0
+        return 0
+    if size >= FIELD_BUFFER_SIZE:
+        size = FIELD_BUFFER_SIZE - 1
+    memcpy(buffer, line + start, size)
+    buffer[size] = 0
+    return size
+
+
+cdef long _int_field(
+        const char* line, Py_ssize_t length, Py_ssize_t start, Py_ssize_t end
+        ) except? -1:
+    cdef char buffer[FIELD_BUFFER_SIZE]
+    cdef long value = 0
+    cdef int i = 0
+    cdef bint negative = False
+    cdef int size = _field_to_buffer(line, length, start, end, buffer)
+    if size and (buffer[0] == b'-' or buffer[0] == b'+'):
+        negative = buffer[0] == b'-'
+        i = 1
+    if i < size <= i + MAX_INT_DIGITS:
+        while i < size and c'0' <= buffer[i] <= c'9':
+            value = value * 10 + (buffer[i] - c'0')
+            i += 1
+        if i == size:
+            return -value if negative else value
+    return int(line[start:min(end, length)].decode('ascii'))
+
+
+cdef double _float_field(
+        const char* line, Py_ssize_t length, Py_ssize_t start, Py_ssize_t end,
+        bint allow_blank=False) except? -1:
+    cdef char buffer[FIELD_BUFFER_SIZE]
+    cdef char* stop = buffer
+    cdef double value = 0.0
+    cdef int size = _field_to_buffer(line, length, start, end, buffer)
+    if size:
+        try:
+            value = PyOS_string_to_double(buffer, &stop, NULL)
+        except ValueError:
+            stop = buffer
+        if stop == buffer + size:
+            return value
+    elif allow_blank:
+        return 0.0
+    return float(line[start:min(end, length)].decode('ascii'))
+
+
+def parse_atom_line(str line):
+    """Extracts data from the columns of an ATOM/HETATM record.
+
+    Parameters
+    ----------
+    line : str
+        An ATOM or HETATM record.
+
+    Returns
+    -------
+    atom_data : tuple
+        The 15 fields of the record, in the order used by `PdbParser`:
+        record name, serial, atom name, alt loc, residue name, chain id,
+        residue sequence number, insertion code, x, y, z, occupancy,
+        temperature factor, element and charge.
+
+    Notes
+    -----
+    Records containing non-ASCII characters are parsed by the pure
+    Python `pdb_parser._parse_atom_line` instead.
+
+    Raises
+    ------
+    ValueError
+        Raised if a numeric field is blank or malformed.
+    """
+    cdef bytes encoded
+    try:
+        encoded = line.encode('ascii')
+    except UnicodeEncodeError:
+        from .pdb_parser import _parse_atom_line
+        return _parse_atom_line(line)
+    cdef const char* buf = encoded
+    cdef Py_ssize_t length = len(encoded)
+    at_ser = _int_field(buf, length, 6, 11)
+    res_seq = _int_field(buf, length, 22, 26)
+    x = _float_field(buf, length, 30, 38)
+    y = _float_field(buf, length, 38, 46)
+    z = _float_field(buf, length, 46, 54)
+    occupancy = _float_field(buf, length, 54, 60)
+    temp_factor = _float_field(buf, length, 60, 66, True)
+    # Labels that are stored on every Atom or Monomer are interned so
+    # that repeats share one string object
+    return (
+        line[0:6].strip(),
+        at_ser,
+        sys.intern(line[12:16].strip()),
+        line[16].strip(),
+        sys.intern(line[17:20].strip()),
+        line[21].strip(),
+        res_seq,
+        line[26].strip(),
+        x,
+        y,
+        z,
+        occupancy,
+        temp_factor,
+        sys.intern(line[76:78].strip()),
+        sys.intern(line[78:80].strip()),
+    )
+
@@ -157,6 +157,11 @@ standard_amino_acids = {
     "Y": "TYR",
 }
 
+# Reverse lookup of standard_amino_acids, used by get_aa_letter. It is
+# built on first use and rebuilt if standard_amino_acids is modified
+_aa_code_to_letter = {}
+_aa_code_to_letter_length = 0
+
 side_chain_dihedrals = {
     "ARG": [
         ["N", "CA", "CB", "CG", "CD", "NE", "CZ", "NH1", "NH2"],
@@ -212,6 +217,29 @@ side_chain_dihedrals = {
     "VAL": [["N", "CA", "CB", "CG1", "CG2"]],
 }
 
+# Heavy side-chain atoms of the standard amino acids, using PDB atom names
+standard_side_chain_atoms = {
+    "ALA": ("CB",),
+    "ARG": ("CB", "CG", "CD", "NE", "CZ", "NH1", "NH2"),
+    "ASN": ("CB", "CG", "OD1", "ND2"),
+    "ASP": ("CB", "CG", "OD1", "OD2"),
+    "CYS": ("CB", "SG"),
+    "GLN": ("CB", "CG", "CD", "OE1", "NE2"),
+    "GLU": ("CB", "CG", "CD", "OE1", "OE2"),
+    "HIS": ("CB", "CG", "ND1", "CD2", "CE1", "NE2"),
+    "ILE": ("CB", "CG1", "CG2", "CD1"),
+    "LEU": ("CB", "CG", "CD1", "CD2"),
+    "LYS": ("CB", "CG", "CD", "CE", "NZ"),
+    "MET": ("CB", "CG", "SD", "CE"),
+    "PHE": ("CB", "CG", "CD1", "CD2", "CE1", "CE2", "CZ"),
+    "PRO": ("CB", "CG", "CD"),
+    "SER": ("CB", "OG"),
+    "THR": ("CB", "OG1", "CG2"),
+    "TRP": ("CB", "CG", "CD1", "CD2", "NE1", "CE2", "CE3", "CZ2", "CZ3", "CH2"),
+    "TYR": ("CB", "CG", "CD1", "CD2", "CE1", "CE2", "CZ", "OH"),
+    "VAL": ("CB", "CG1", "CG2"),
+}
+
 # Data taken from http://web.expasy.org/protscale/ unless otherwise stated. Original reference also given.
 # Levitt M. Biochemistry 17:4277-4285(1978)
 a_helix_Levitt = {
@@ -734,12 +762,7 @@ def get_aa_code(aa_letter):
     aa_code : str, or None
         Three-letter aa code.
     """
-    aa_code = None
-    if aa_letter != "X":
-        for key, val in standard_amino_acids.items():
-            if key == aa_letter:
-                aa_code = val
-    return aa_code
+    return standard_amino_acids.get(aa_letter)
 
 
 def get_aa_letter(aa_code):
@@ -755,12 +778,26 @@ def get_aa_letter(aa_code):
     aa_letter : str
         One-letter aa code.
         Default value is 'X'.
-    """
-    aa_letter = "X"
-    for key, val in standard_amino_acids.items():
-        if val == aa_code:
-            aa_letter = key
 
+    Notes
+    -----
+    Codes are looked up in a reverse mapping of `standard_amino_acids`.
+    The mapping is rebuilt if the number of amino acids has changed,
+    if the code is not found, or if the letter found no longer maps to
+    the code, so changes to `standard_amino_acids` are always seen.
+    """
+    global _aa_code_to_letter, _aa_code_to_letter_length
+    aa_letter = _aa_code_to_letter.get(aa_code)
+    if (
+        (aa_letter is None)
+        or (_aa_code_to_letter_length != len(standard_amino_acids))
+        or (standard_amino_acids.get(aa_letter) != aa_code)
+    ):
+        _aa_code_to_letter = {
+            code: letter for letter, code in standard_amino_acids.items()
+        }
+        _aa_code_to_letter_length = len(standard_amino_acids)
+        aa_letter = _aa_code_to_letter.get(aa_code, "X")
     return aa_letter
 
 def get_aa_info(code):
@@ -845,7 +882,7 @@ def add_amino_acid_to_json(
 
     """
     # If code is already in the dictionary, raise an error
-    if (not force_add) and code in AMINO_ACIDS_DATA.keys():
+    if (not force_add) and code in AMINO_ACIDS_DATA:
         raise IOError(
             "{0} is already in the amino_acids dictionary, with values: {1}".format(
                 code, AMINO_ACIDS_DATA[code]
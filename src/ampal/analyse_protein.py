@@ -1,6 +1,7 @@
 """Contains various tools for analysing protein structure."""
 
 from collections import Counter
+import functools
 import typing as t
 import warnings
 
@@ -42,6 +43,11 @@ def sequence_molecular_weight(seq):
     """
     if "X" in seq:
         warnings.warn(_nc_warning_str, NoncanonicalWarning)
+    return _sequence_molecular_weight(seq)
+
+
+@functools.lru_cache(maxsize=128)
+def _sequence_molecular_weight(seq):
     return sum([residue_mwt[aa] * n for aa, n in Counter(seq).items()]) + water_mass
 
 
@@ -61,6 +67,11 @@ def sequence_molar_extinction_280(seq):
     """
     if "X" in seq:
         warnings.warn(_nc_warning_str, NoncanonicalWarning)
+    return _sequence_molar_extinction_280(seq)
+
+
+@functools.lru_cache(maxsize=128)
+def _sequence_molar_extinction_280(seq):
     return sum([residue_ext_280[aa] * n for aa, n in Counter(seq).items()])
 
 
@@ -133,6 +144,11 @@ def sequence_isoelectric_point(seq, granularity=0.1):
     """
     if "X" in seq:
         warnings.warn(_nc_warning_str, NoncanonicalWarning)
+    return _sequence_isoelectric_point(seq, granularity)
+
+
+@functools.lru_cache(maxsize=128)
+def _sequence_isoelectric_point(seq, granularity):
     ph_range, charge_at_ph = charge_series(seq, granularity)
     abs_charge_at_ph = [abs(ch) for ch in charge_at_ph]
     pi_index = min(enumerate(abs_charge_at_ph), key=lambda x: x[1])[0]
@@ -223,6 +239,54 @@ def measure_sidechain_torsion_angles(
     return (chi_angles, rotamers)
 
 
+def _measure_sidechain_torsion_angles(residues):
+    """Calculates sidechain dihedral angles for a list of residues.
+
+    Notes
+    -----
+    Gives the same result as calling `measure_sidechain_torsion_angles`
+    on each residue with `verbose=False`, but measures all the dihedrals
+    in a single vectorised pass.
+
+    Parameters
+    ----------
+    residues : [ampal.Residue]
+        List of `Residue` objects.
+
+    Returns
+    -------
+    torsion_angles : [([float], [int])]
+        One (chi_angles, rotamers) pair for each residue.
+    """
+    torsion_angles = []
+    dihedral_points = []
+    # (chi_angles, rotamers, index) of each measured dihedral
+    assignments = []
+    for residue in residues:
+        chi_angles = []
+        rotamers = []
+        for set_atoms in side_chain_dihedrals.get(residue.mol_code, []):
+            try:
+                dihedral_points.append([residue[x]._vector for x in set_atoms[0:4]])
+            except KeyError as k:
+                print(
+                    "{0} atom missing from residue {1} {2} "
+                    "- can't assign dihedral".format(k, residue.mol_code, residue.id)
+                )
+            else:
+                assignments.append((chi_angles, rotamers, len(chi_angles)))
+            chi_angles.append(None)
+            rotamers.append(None)
+        torsion_angles.append((chi_angles, rotamers))
+    if dihedral_points:
+        points = numpy.array(dihedral_points, dtype=float)
+        angles = _dihedrals(points[:, 0], points[:, 1], points[:, 2], points[:, 3])
+        for (chi_angles, rotamers, i), angle in zip(assignments, angles.tolist()):
+            chi_angles[i] = angle
+            rotamers[i] = classify_angle_as_rotamer(angle)
+    return torsion_angles
+
+
 def measure_torsion_angles(residues):
     """Calculates the dihedral angles for a list of backbone atoms.
 
@@ -248,89 +312,155 @@ def measure_torsion_angles(residues):
         If the number of input residues is less than 2.
     """
     if len(residues) < 2:
-        torsion_angles = [(None, None, None)] * len(residues)
-    else:
-        torsion_angles = []
-        for i in range(len(residues)):
-            if i == 0:
-                res1 = residues[i]
-                res2 = residues[i + 1]
+        return [(None, None, None)] * len(residues)
+    try:
+        backbone = numpy.array(
+            [(r["N"]._vector, r["CA"]._vector, r["C"]._vector) for r in residues],
+            dtype=float,
+        )
+    except KeyError:
+        # Missing atoms are reported for each torsion angle they affect
+        return _measure_torsion_angles_by_residue(residues)
+    n, ca, c = backbone[:, 0], backbone[:, 1], backbone[:, 2]
+    omegas = _dihedrals(ca[:-1], c[:-1], n[1:], ca[1:]).tolist()
+    phis = _dihedrals(c[:-1], n[1:], ca[1:], c[1:]).tolist()
+    psis = _dihedrals(n[:-1], ca[:-1], c[:-1], n[1:]).tolist()
+    return list(zip([None] + omegas, [None] + phis, psis + [None]))
+
+
+def _measure_torsion_angles_by_residue(residues):
+    """Calculates the dihedral angles one residue at a time.
+
+    Notes
+    -----
+    Used by `measure_torsion_angles` when backbone atoms are missing,
+    so that a warning is given for each angle that can't be assigned.
+    """
+    torsion_angles = []
+    for i in range(len(residues)):
+        if i == 0:
+            res1 = residues[i]
+            res2 = residues[i + 1]
+            omega = None
+            phi = None
+            try:
+                psi = dihedral(
+                    res1["N"]._vector,
+                    res1["CA"]._vector,
+                    res1["C"]._vector,
+                    res2["N"]._vector,
+                )
+            except KeyError as k:
+                warnings.warn("{0} atom missing - can't assign psi".format(k))
+                psi = None
+            torsion_angles.append((omega, phi, psi))
+        elif i == len(residues) - 1:
+            res1 = residues[i - 1]
+            res2 = residues[i]
+            try:
+                omega = dihedral(
+                    res1["CA"]._vector,
+                    res1["C"]._vector,
+                    res2["N"]._vector,
+                    res2["CA"]._vector,
+                )
+            except KeyError as k:
+                warnings.warn("{0} atom missing - can't assign omega".format(k))
                 omega = None
+            try:
+                phi = dihedral(
+                    res1["C"]._vector,
+                    res2["N"]._vector,
+                    res2["CA"]._vector,
+                    res2["C"]._vector,
+                )
+            except KeyError as k:
+                warnings.warn("{0} atom missing - can't assign phi".format(k))
                 phi = None
-                try:
-                    psi = dihedral(
-                        res1["N"]._vector,
-                        res1["CA"]._vector,
-                        res1["C"]._vector,
-                        res2["N"]._vector,
-                    )
-                except KeyError as k:
-                    warnings.warn("{0} atom missing - can't assign psi".format(k))
-                    psi = None
-                torsion_angles.append((omega, phi, psi))
-            elif i == len(residues) - 1:
-                res1 = residues[i - 1]
-                res2 = residues[i]
-                try:
-                    omega = dihedral(
-                        res1["CA"]._vector,
-                        res1["C"]._vector,
-                        res2["N"]._vector,
-                        res2["CA"]._vector,
-                    )
-                except KeyError as k:
-                    warnings.warn("{0} atom missing - can't assign omega".format(k))
-                    omega = None
-                try:
-                    phi = dihedral(
-                        res1["C"]._vector,
-                        res2["N"]._vector,
-                        res2["CA"]._vector,
-                        res2["C"]._vector,
-                    )
-                except KeyError as k:
-                    warnings.warn("{0} atom missing - can't assign phi".format(k))
-                    phi = None
+            psi = None
+            torsion_angles.append((omega, phi, psi))
+        else:
+            res1 = residues[i - 1]
+            res2 = residues[i]
+            res3 = residues[i + 1]
+            try:
+                omega = dihedral(
+                    res1["CA"]._vector,
+                    res1["C"]._vector,
+                    res2["N"]._vector,
+                    res2["CA"]._vector,
+                )
+            except KeyError as k:
+                warnings.warn("{0} atom missing - can't assign omega".format(k))
+                omega = None
+            try:
+                phi = dihedral(
+                    res1["C"]._vector,
+                    res2["N"]._vector,
+                    res2["CA"]._vector,
+                    res2["C"]._vector,
+                )
+            except KeyError as k:
+                warnings.warn("{0} atom missing - can't assign phi".format(k))
+                phi = None
+            try:
+                psi = dihedral(
+                    res2["N"]._vector,
+                    res2["CA"]._vector,
+                    res2["C"]._vector,
+                    res3["N"]._vector,
+                )
+            except KeyError as k:
+                warnings.warn("{0} atom missing - can't assign psi".format(k))
                 psi = None
-                torsion_angles.append((omega, phi, psi))
-            else:
-                res1 = residues[i - 1]
-                res2 = residues[i]
-                res3 = residues[i + 1]
-                try:
-                    omega = dihedral(
-                        res1["CA"]._vector,
-                        res1["C"]._vector,
-                        res2["N"]._vector,
-                        res2["CA"]._vector,
-                    )
-                except KeyError as k:
-                    warnings.warn("{0} atom missing - can't assign omega".format(k))
-                    omega = None
-                try:
-                    phi = dihedral(
-                        res1["C"]._vector,
-                        res2["N"]._vector,
-                        res2["CA"]._vector,
-                        res2["C"]._vector,
-                    )
-                except KeyError as k:
-                    warnings.warn("{0} atom missing - can't assign phi".format(k))
-                    phi = None
-                try:
-                    psi = dihedral(
-                        res2["N"]._vector,
-                        res2["CA"]._vector,
-                        res2["C"]._vector,
-                        res3["N"]._vector,
-                    )
-                except KeyError as k:
-                    warnings.warn("{0} atom missing - can't assign psi".format(k))
-                    psi = None
-                torsion_angles.append((omega, phi, psi))
+            torsion_angles.append((omega, phi, psi))
     return torsion_angles
 
 
+def _dihedrals(a, b, c, d):
+    """Calculates the dihedral angles for rows of four arrays of points.
+
+    Notes
+    -----
+    Vectorised form of `geometry.dihedral`, returning angles in degrees
+    and 0.0 where either plane is undefined.
+
+    Parameters
+    ----------
+    a : numpy.array
+    b : numpy.array
+    c : numpy.array
+    d : numpy.array
+        Arrays of shape (k, 3).
+
+    Returns
+    -------
+    angles : numpy.array
+        Array of shape (k,).
+    """
+    small_number = 1e-7
+    q = c - b
+    n1 = numpy.cross(b - a, q)
+    n2 = numpy.cross(q, d - c)
+    n3 = numpy.cross(n1, n2)
+    mag_n1 = numpy.linalg.norm(n1, axis=1)
+    mag_n2 = numpy.linalg.norm(n2, axis=1)
+    mag_q = numpy.linalg.norm(q, axis=1)
+    mag_n3 = numpy.linalg.norm(n3, axis=1)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        cos_angles = numpy.einsum("ij,ij->i", n1, n2) / (mag_n1 * mag_n2)
+        cos_q_n3 = numpy.einsum("ij,ij->i", q, n3) / (mag_q * mag_n3)
+    angles = numpy.degrees(numpy.arccos(numpy.clip(cos_angles, -1.0, 1.0)))
+    negative = (
+        (mag_q >= small_number)
+        & (mag_n3 >= small_number)
+        & (numpy.arccos(numpy.clip(cos_q_n3, -1.0, 1.0)) > small_number)
+    )
+    angles[negative] *= -1
+    angles[(mag_n1 < small_number) | (mag_n2 < small_number)] = 0.0
+    return angles
+
+
 # TODO: Find a home for this
 def cc_to_local_params(pitch, radius, oligo):
     """Returns local parameters for an oligomeric assembly.
@@ -382,8 +512,11 @@ def residues_per_turn(p):
     rpts : [float]
         Residue per turn values.
     """
-    cas = p.get_reference_coords()
-    prim_cas = p.primitive.coordinates
+    return _residues_per_turn(p.get_reference_coords(), p.primitive.coordinates)
+
+
+def _residues_per_turn(cas, prim_cas):
+    """Residues per turn from the CA and primitive coordinates."""
     dhs = [
         abs(dihedral(cas[i], prim_cas[i], prim_cas[i + 1], cas[i + 1]))
         for i in range(len(prim_cas) - 1)
@@ -439,9 +572,9 @@ def polymer_to_reference_axis_distances(
             "The reference axis must contain the same number of points "
             "as the Polymer primitive."
         )
-    prim_cas = p.primitive.coordinates
-    ref_points = reference_axis.coordinates
-    distances = [distance(prim_cas[i], ref_points[i]) for i in range(len(prim_cas))]
+    distances = _reference_axis_distances(
+        p.primitive.coordinates, reference_axis.coordinates
+    )
     if tag:
         p.tags[reference_axis_name] = reference_axis
         monomer_tag_name = "distance_to_{0}".format(reference_axis_name)
@@ -450,6 +583,11 @@ def polymer_to_reference_axis_distances(
     return distances
 
 
+def _reference_axis_distances(prim_cas, ref_points):
+    """Distances between the primitive and the reference axis coordinates."""
+    return [distance(prim_cas[i], ref_points[i]) for i in range(len(prim_cas))]
+
+
 def crick_angles(p, reference_axis, tag=True, reference_axis_name="ref_axis"):
     """Returns the Crick angle for each CA atom in the `Polymer`.
 
@@ -488,15 +626,9 @@ def crick_angles(p, reference_axis, tag=True, reference_axis_name="ref_axis"):
             "The reference axis must contain the same number of points"
             " as the Polymer primitive."
         )
-    prim_cas = p.primitive.coordinates
-    p_cas = p.get_reference_coords()
-    ref_points = reference_axis.coordinates
-    cr_angles = [
-        dihedral(ref_points[i], prim_cas[i], prim_cas[i + 1], p_cas[i])
-        for i in range(len(prim_cas) - 1)
-    ]
-    cr_angles.append(None)
-
+    cr_angles = _crick_angles(
+        p.get_reference_coords(), p.primitive.coordinates, reference_axis.coordinates
+    )
     if tag:
         p.tags[reference_axis_name] = reference_axis
         monomer_tag_name = "crick_angle_{0}".format(reference_axis_name)
@@ -505,6 +637,16 @@ def crick_angles(p, reference_axis, tag=True, reference_axis_name="ref_axis"):
     return cr_angles
 
 
+def _crick_angles(cas, prim_cas, ref_points):
+    """Crick angles from the CA, primitive and reference axis coordinates."""
+    cr_angles = [
+        dihedral(ref_points[i], prim_cas[i], prim_cas[i + 1], cas[i])
+        for i in range(len(prim_cas) - 1)
+    ]
+    cr_angles.append(None)
+    return cr_angles
+
+
 def alpha_angles(p, reference_axis, tag=True, reference_axis_name="ref_axis"):
     """Alpha angle calculated using points on the primitive of helix and axis.
 
@@ -545,14 +687,7 @@ def alpha_angles(p, reference_axis, tag=True, reference_axis_name="ref_axis"):
             "The reference axis must contain the same number of points "
             "as the Polymer primitive."
         )
-    prim_cas = p.primitive.coordinates
-    ref_points = reference_axis.coordinates
-    alphas = [
-        abs(dihedral(ref_points[i + 1], ref_points[i], prim_cas[i], prim_cas[i + 1]))
-        for i in range(len(prim_cas) - 1)
-    ]
-    alphas.append(None)
-
+    alphas = _alpha_angles(p.primitive.coordinates, reference_axis.coordinates)
     if tag:
         p.tags[reference_axis_name] = reference_axis
         monomer_tag_name = "alpha_angle_{0}".format(reference_axis_name)
@@ -561,6 +696,16 @@ def alpha_angles(p, reference_axis, tag=True, reference_axis_name="ref_axis"):
     return alphas
 
 
+def _alpha_angles(prim_cas, ref_points):
+    """Alpha angles from the primitive and reference axis coordinates."""
+    alphas = [
+        abs(dihedral(ref_points[i + 1], ref_points[i], prim_cas[i], prim_cas[i + 1]))
+        for i in range(len(prim_cas) - 1)
+    ]
+    alphas.append(None)
+    return alphas
+
+
 def polypeptide_vector(p, start_index=0, end_index=-1, unit=True):
     """Vector along the Chain primitive (default is from N-terminus to C-terminus).
 
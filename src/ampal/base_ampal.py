@@ -194,8 +194,40 @@ class BaseAmpal(object):
             alternate conformations for sidechains.
         """
         q = Quaternion.angle_and_axis(angle=angle, axis=axis, radians=radians)
-        for atom in self.get_atoms(inc_alt_states=inc_alt_states):
-            atom._vector = q.rotate_vector(v=atom._vector, point=point)
+        transformation = numpy.identity(4)
+        transformation[:3, :3] = q.as_matrix()
+        if point is not None:
+            point = numpy.array(point, dtype=float)
+            transformation[:3, 3] = point - (transformation[:3, :3] @ point)
+        self._apply_transformation(transformation, inc_alt_states=inc_alt_states)
+        return
+
+    def _apply_transformation(self, transformation, inc_alt_states=True):
+        """Applies a homogeneous transformation to every atom.
+
+        Notes
+        -----
+        All the coordinates are transformed with a single matrix
+        product, and each atom is given its own copy of its new
+        coordinates, so no two atoms share a coordinate array.
+
+        Parameters
+        ----------
+        transformation : numpy.array
+            (4 x 4) transformation matrix, such as those returned by
+            `geometry.rotation_matrix`.
+        inc_alt_states : bool, optional
+            If true, will transform atoms in all states i.e. includes
+            alternate conformations for sidechains.
+        """
+        atoms = list(self.get_atoms(inc_alt_states=inc_alt_states))
+        if not atoms:
+            return
+        coordinates = numpy.array([atom._vector for atom in atoms], dtype=float)
+        # Coordinates are rows, so they are multiplied by the transpose
+        coordinates = (coordinates @ transformation[:3, :3].T) + transformation[:3, 3]
+        for atom, vector in zip(atoms, coordinates):
+            atom._vector = numpy.array(vector)
         return
 
     def translate(self, vector, inc_alt_states=True):
@@ -320,6 +352,8 @@ class Polymer(BaseAmpal):
         self.ligands = ligands
         self.tags = {}
         self.sl = sl
+        self._id_index = {}
+        self._id_index_length = 0
 
     def __add__(self, other):
         if isinstance(other, Polymer):
@@ -333,12 +367,49 @@ class Polymer(BaseAmpal):
 
     def __getitem__(self, item):
         if isinstance(item, str):
-            id_dict = {str(m.id): m for m in self._monomers}
-            return id_dict[item]
+            return self._monomers[self._monomer_position(item)]
         elif isinstance(item, int):
             return self._monomers[item]
         return Polymer(self._monomers[item], polymer_id=self.id)
 
+    def _monomer_position(self, monomer_id):
+        """Returns the index of the `Monomer` with the given id.
+
+        Notes
+        -----
+        Positions are cached by id. If ids are duplicated, the last
+        `Monomer` with the id is returned. The cache is cleared by the
+        `Polymer` methods that add or relabel `Monomers`. It is also
+        rebuilt if the number of `Monomers` has changed since it was
+        built, or if the `Monomer` at the cached position no longer has
+        the requested id. This covers direct edits of `_monomers`, but
+        not assigning an id to a `Monomer` that duplicates another id
+        in the `Polymer`; call `relabel_monomers` or `_clear_id_index`
+        after doing that. Polymers unpickled from earlier releases have
+        no cache, so it is created on first use.
+
+        Raises
+        ------
+        KeyError
+            Raised if no `Monomer` has the id.
+        """
+        position = getattr(self, "_id_index", {}).get(monomer_id)
+        if (
+            (position is None)
+            or (getattr(self, "_id_index_length", 0) != len(self._monomers))
+            or (str(self._monomers[position].id) != monomer_id)
+        ):
+            self._id_index = {str(m.id): i for i, m in enumerate(self._monomers)}
+            self._id_index_length = len(self._monomers)
+            position = self._id_index[monomer_id]
+        return position
+
+    def _clear_id_index(self):
+        """Clears the cache used to look up `Monomers` by id."""
+        self._id_index = {}
+        self._id_index_length = 0
+        return
+
     def __repr__(self):
         return "<Polymer containing {} {}>".format(
             len(self._monomers), "Monomer" if len(self._monomers) == 1 else "Monomers"
@@ -353,6 +424,7 @@ class Polymer(BaseAmpal):
         """
         if isinstance(item, Monomer):
             self._monomers.append(item)
+            self._clear_id_index()
         else:
             raise TypeError("Only Monomer objects can be appended to an Polymer.")
         return
@@ -366,6 +438,7 @@ class Polymer(BaseAmpal):
         """
         if isinstance(polymer, Polymer):
             self._monomers.extend(polymer._monomers)
+            self._clear_id_index()
         else:
             raise TypeError(
                 'Only Polymer objects may be merged with a Polymer using "+".'
@@ -437,6 +510,7 @@ class Polymer(BaseAmpal):
         else:
             for i, monomer in enumerate(self._monomers):
                 monomer.id = str(i + 1)
+        self._clear_id_index()
         return
 
     def relabel_atoms(self, start=1):
@@ -566,7 +640,7 @@ class Monomer(BaseAmpal):
 
     @active_state.setter
     def active_state(self, value):
-        if value in self.states.keys():
+        if value in self.states:
             self._active_state = value
         else:
             raise KeyError(
@@ -115,6 +115,29 @@ def unit_vector(a):
         raise ZeroDivisionError("Vector must be of non-zero length.")
 
 
+def cross_product(a, b):
+    """Calculates the cross product of two vectors in R^3.
+
+    Notes
+    -----
+    Gives the same result as `numpy.cross` for a pair of 3-vectors, without
+    the overhead of its general, broadcasting implementation.
+
+    Parameters
+    ----------
+    a : list or tuple or numpy.array
+    b : list or tuple or numpy.array
+
+    Returns
+    -------
+    cross : numpy.array
+        The vector perpendicular to a and b.
+    """
+    cdef double[3] a_v = a
+    cdef double[3] b_v = b
+    return numpy.array(_cross_product(a_v, b_v))
+
+
 cdef _unit_vector(double[3] a):
     cdef double[3] v_out
     vector_length = _magnitude(a)
@@ -417,28 +440,33 @@ def rotation_matrix(angle, unit_vect, point=None):
     m : numpy.array
         A (4 x 4) rotation matrix.
     """
-    cdef double sina, cosa
+    cdef double sina, cosa, one_minus_cosa
+    cdef double[3] d
+    cdef double[:, ::1] m_view
+    cdef int i, j
     # TODO Confirm whether we want the input angle to be in degrees or radians. Change unit vector to internally do this.
     sina = sin(angle)
     cosa = cos(angle)
+    one_minus_cosa = 1.0 - cosa
     # TODO use the unit_vector function here so that the function can take a vector of arbitrary length.
-    direction = numpy.array([float(x) for x in unit_vect])
-
+    d = [float(x) for x in unit_vect]
+    m = numpy.identity(4)
+    m_view = m
     # rotation matrix around unit vector
-    r = numpy.diag([cosa, cosa, cosa])
-    r += numpy.outer(direction, direction) * (1.0 - cosa)
-
+    for i in range(3):
+        for j in range(3):
+            m_view[i, j] = (cosa if i == j else 0.0) + d[i] * d[j] * one_minus_cosa
     # cross product matrix of the unit_vector multiplied by sina
-    direction *= sina
-    r += numpy.array([[0.0, -direction[2], direction[1]],
-                      [direction[2], 0.0, -direction[0]],
-                      [-direction[1], direction[0], 0.0]])
-    m = numpy.identity(4)
-    m[:3, :3] = r
+    m_view[0, 1] += -(d[2] * sina)
+    m_view[0, 2] += d[1] * sina
+    m_view[1, 0] += d[2] * sina
+    m_view[1, 2] += -(d[0] * sina)
+    m_view[2, 0] += -(d[1] * sina)
+    m_view[2, 1] += d[0] * sina
     if point is not None:
         # rotation not around origin
         point = numpy.array(point[:3], dtype=numpy.float64, copy=False)
-        m[:3, 3] = point - numpy.dot(r, point)
+        m[:3, 3] = point - numpy.dot(m[:3, :3], point)
     return m
 
 
@@ -970,7 +998,7 @@ def find_transformations(s1, e1, s2, e2, radians=False):
     v2 = e2 - s2
     angle = angle_between_vectors(v1, v2, radians=radians)
     if not numpy.isclose(angle, 0):
-        axis = numpy.cross(v1, v2)
+        axis = cross_product(v1, v2)
         # if v1 and v2 parallel or antiparallel
         if numpy.allclose(axis, [0, 0, 0]):
             p = numpy.array([1, 0, 0])
@@ -1220,6 +1248,16 @@ class Quaternion:
         else:
             raise AttributeError('Quaternion is not a rotation quaternion.')
 
+    def as_matrix(self):
+        """ Returns the 3x3 matrix of the rotation that the Quaternion represents. """
+        if not self.is_rotation:
+            raise AttributeError('Quaternion is not a rotation quaternion.')
+        r, i, j, k = self.r, self.i, self.j, self.k
+        return numpy.array([
+            [1 - 2 * (j**2 + k**2), 2 * (i * j - k * r), 2 * (i * k + j * r)],
+            [2 * (i * j + k * r), 1 - 2 * (i**2 + k**2), 2 * (j * k - i * r)],
+            [2 * (i * k - j * r), 2 * (j * k + i * r), 1 - 2 * (i**2 + j**2)]])
+
 
 ##### PARAMETERISED CURVES #######
 class Curve(object):
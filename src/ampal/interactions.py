@@ -1,10 +1,12 @@
 """Contains code for analysing chemical interactions in AMPAL objects."""
 
+import functools
 import itertools
 import networkx
+import numpy
 
 from .data import ELEMENT_DATA
-from .geometry import distance, gen_sectors
+from .geometry import distance
 
 core_components = [
     "ALA",
@@ -31,6 +33,12 @@ core_components = [
 ]
 
 
+@functools.lru_cache(maxsize=None)
+def _atomic_radius(element):
+    """Atomic radius (pm) of an element, from its symbol in any case."""
+    return ELEMENT_DATA[element.title()]["atomic radius"]
+
+
 class Interaction(object):
     """A container for all types of interaction with donor and acceptor.
 
@@ -53,6 +61,8 @@ class Interaction(object):
         The distance between `Atom` `a` and `b`.
     """
 
+    __slots__ = ("_a", "_b", "dist")
+
     def __init__(self, a, b, dist):
         self._a = a
         self._b = b
@@ -77,6 +87,8 @@ class Interaction(object):
 class CovalentBond(Interaction):
     """Defines a covalent bond."""
 
+    __slots__ = ()
+
     @property
     def a(self):
         """One `Atom` involved in the covalent bond."""
@@ -126,6 +138,8 @@ class NonCovalentInteraction(Interaction):
         The distance between `Atom` `a` and `b`.
     """
 
+    __slots__ = ()
+
     def __init__(self, donor, acceptor, dist):
         super().__init__(donor, acceptor, dist)
 
@@ -180,6 +194,8 @@ class HydrogenBond(NonCovalentInteraction):
         Angle between the donor and the interaction vector.
     """
 
+    __slots__ = ("ang_d", "ang_a")
+
     def __init__(self, donor, acceptor, dist, ang_d, ang_a):
         super().__init__(donor, acceptor, dist)
         self.ang_d = ang_d
@@ -231,16 +247,107 @@ def covalent_bonds(atoms, threshold=1.1):
     """
     bonds = []
     for a, b in atoms:
-        bond_distance = (
-            ELEMENT_DATA[a.element.title()]["atomic radius"]
-            + ELEMENT_DATA[b.element.title()]["atomic radius"]
-        ) / 100
+        bond_distance = (_atomic_radius(a.element) + _atomic_radius(b.element)) / 100
         dist = distance(a._vector, b._vector)
         if dist <= bond_distance * threshold:
             bonds.append(CovalentBond(a, b, dist))
     return bonds
 
 
+def _close_atom_pairs(coordinates, cell_size):
+    """Finds pairs of points that lie in the same or in adjacent grid cells.
+
+    Notes
+    -----
+    Points are binned into a cubic grid with sides of length `cell_size`,
+    so every pair of points closer than `cell_size` is returned, along
+    with some more distant pairs.
+
+    Parameters
+    ----------
+    coordinates : numpy.array
+        (N, 3) array of coordinates.
+    cell_size : float
+        Length of the sides of the grid cells.
+
+    Returns
+    -------
+    i : numpy.array
+        Index of the first point in each pair.
+    j : numpy.array
+        Index of the second point in each pair, always greater than `i`.
+    """
+    n_points = len(coordinates)
+    if n_points == 0:
+        return numpy.zeros(0, dtype=int), numpy.zeros(0, dtype=int)
+    cells = numpy.floor(coordinates / cell_size).astype(int)
+    # Pad the grid by a cell on each side so that neighbour offsets never wrap
+    cells -= cells.min(axis=0) - 1
+    dims = cells.max(axis=0) + 2
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    order = numpy.argsort(keys, kind="stable")
+    cell_keys, starts, counts = numpy.unique(
+        keys[order], return_index=True, return_counts=True
+    )
+    point_cells = numpy.searchsorted(cell_keys, keys)
+    first_indices = []
+    second_indices = []
+    # Half of the neighbouring cells, plus the cell itself, covers every pair once
+    half_shell = [
+        offset
+        for offset in itertools.product((-1, 0, 1), repeat=3)
+        if offset >= (0, 0, 0)
+    ]
+    for dx, dy, dz in half_shell:
+        neighbour_keys = cell_keys + (dx * dims[1] + dy) * dims[2] + dz
+        neighbours = numpy.searchsorted(cell_keys, neighbour_keys)
+        neighbours[neighbours == len(cell_keys)] = 0
+        occupied = cell_keys[neighbours] == neighbour_keys
+        point_neighbours = neighbours[point_cells]
+        n_pairs = numpy.where(occupied[point_cells], counts[point_neighbours], 0)
+        i = numpy.repeat(numpy.arange(n_points), n_pairs)
+        # Walk through the sorted points of each neighbouring cell
+        positions = numpy.arange(n_pairs.sum()) + numpy.repeat(
+            starts[point_neighbours] - (numpy.cumsum(n_pairs) - n_pairs), n_pairs
+        )
+        j = order[positions]
+        if (dx, dy, dz) == (0, 0, 0):
+            forward = i < j
+            i, j = i[forward], j[forward]
+        first_indices.append(numpy.minimum(i, j))
+        second_indices.append(numpy.maximum(i, j))
+    i = numpy.concatenate(first_indices)
+    j = numpy.concatenate(second_indices)
+    pair_order = numpy.argsort(i * n_points + j)
+    return i[pair_order], j[pair_order]
+
+
+def _covalent_bonds_from_pairs(i, j, atoms, coordinates, radii, threshold=1.1):
+    """Finds the covalent bonds among candidate pairs of atoms.
+
+    Parameters
+    ----------
+    i, j : numpy.array
+        Indices of the first and second atom of each candidate pair.
+    atoms : [ampal.Atom]
+        All atoms being searched, `i` and `j` refer to this list.
+    coordinates : numpy.array
+        (N, 3) array of the coordinates of `atoms`.
+    radii : numpy.array
+        Atomic radius (pm) of each atom in `atoms`.
+    threshold : float, optional
+        Allows deviation from ideal covalent bond distance to be included.
+    """
+    # Compare squared distances so only bonded pairs need a square root
+    sq_dists = numpy.sum((coordinates[i] - coordinates[j]) ** 2, axis=1)
+    bonded = sq_dists <= (((radii[i] + radii[j]) / 100) * threshold) ** 2
+    dists = numpy.sqrt(sq_dists[bonded])
+    return [
+        CovalentBond(atoms[a], atoms[b], dist)
+        for a, b, dist in zip(i[bonded].tolist(), j[bonded].tolist(), dists.tolist())
+    ]
+
+
 def find_covalent_bonds(ampal, max_range=2.2, threshold=1.1, tag=True):
     """Finds all covalent bonds in the AMPAL object.
 
@@ -249,7 +356,7 @@ def find_covalent_bonds(ampal, max_range=2.2, threshold=1.1, tag=True):
     ampal : AMPAL Object
         Any AMPAL object with a `get_atoms` method.
     max_range : float, optional
-        Used to define the sector size, so interactions at longer ranges
+        Used to define the grid cell size, so interactions at longer ranges
         will not be found.
     threshold : float, optional
         Allows deviation from ideal covalent bond distance to be included.
@@ -260,14 +367,15 @@ def find_covalent_bonds(ampal, max_range=2.2, threshold=1.1, tag=True):
         each `Atom` involved in the interaction under the `covalent_bonds`
         key.
     """
-    sectors = gen_sectors(ampal.get_atoms(), max_range * 1.1)
-    bonds = []
-    for sector in sectors.values():
-        atoms = itertools.combinations(sector, 2)
-        bonds.extend(covalent_bonds(atoms, threshold=threshold))
-    bond_set = list(set(bonds))
+    atoms = list(ampal.get_atoms())
+    coordinates = numpy.array([atom._vector for atom in atoms], dtype=float)
+    radii = numpy.array([_atomic_radius(atom.element) for atom in atoms])
+    i, j = _close_atom_pairs(coordinates, max_range * 1.1)
+    bonds = _covalent_bonds_from_pairs(
+        i, j, atoms, coordinates, radii, threshold=threshold
+    )
     if tag:
-        for bond in bond_set:
+        for bond in bonds:
             a, b = bond.a, bond.b
             if "covalent_bonds" not in a.tags:
                 a.tags["covalent_bonds"] = [b]
@@ -277,7 +385,7 @@ def find_covalent_bonds(ampal, max_range=2.2, threshold=1.1, tag=True):
                 b.tags["covalent_bonds"] = [a]
             else:
                 b.tags["covalent_bonds"].append(a)
-    return bond_set
+    return bonds
 
 
 def generate_covalent_bond_graph(covalent_bonds):
@@ -294,8 +402,7 @@ def generate_covalent_bond_graph(covalent_bonds):
         A graph of the covalent bond network.
     """
     bond_graph = networkx.Graph()
-    for inter in covalent_bonds:
-        bond_graph.add_edge(inter.a, inter.b)
+    bond_graph.add_edges_from((inter.a, inter.b) for inter in covalent_bonds)
     return bond_graph
 
 
@@ -323,7 +430,15 @@ def generate_bond_subgraphs_from_break(bond_graph, atom1, atom2):
     """
     bond_graph.remove_edge(atom1, atom2)
     try:
-        subgraphs = list(networkx.connected_component_subgraphs(bond_graph, copy=False))
+        components = [networkx.node_connected_component(bond_graph, atom1)]
+        if atom2 not in components[0]:
+            components.append(networkx.node_connected_component(bond_graph, atom2))
+        remaining = set(bond_graph).difference(*components)
+        if remaining:
+            components.extend(
+                networkx.connected_components(bond_graph.subgraph(remaining))
+            )
+        subgraphs = [bond_graph.subgraph(component).copy() for component in components]
     finally:
         # Add edge
         bond_graph.add_edge(atom1, atom2)
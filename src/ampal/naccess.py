@@ -1,5 +1,7 @@
 """This module provides an interface to the program NACCESS."""
 
+from concurrent.futures import ProcessPoolExecutor
+import functools
 import subprocess
 import tempfile
 import os
@@ -69,25 +71,22 @@ def run_naccess(
         with open(pdb, "r") as inf:
             pdb = inf.read().encode()
 
-    this_dir = os.getcwd()
     # temp pdb file in temp dir.
     temp_dir = tempfile.TemporaryDirectory()
     temp_pdb = tempfile.NamedTemporaryFile(dir=temp_dir.name)
     temp_pdb.write(pdb)
     temp_pdb.seek(0)
     # run naccess in the temp_dir. Files created will be written here.
-    os.chdir(temp_dir.name)
-
     if include_hetatms:
         naccess_args = "-h"
-        subprocess.check_output([naccess_exe, naccess_args, temp_pdb.name])
+        subprocess.check_output(
+            [naccess_exe, naccess_args, temp_pdb.name], cwd=temp_dir.name
+        )
     else:
-        subprocess.check_output([naccess_exe, temp_pdb.name])
+        subprocess.check_output([naccess_exe, temp_pdb.name], cwd=temp_dir.name)
     temp_pdb.close()
-    with open(".{}".format(mode), "r") as inf:
+    with open(os.path.join(temp_dir.name, ".{}".format(mode)), "r") as inf:
         naccess_out = inf.read()
-    # navigate back to initial directory and clean up.
-    os.chdir(this_dir)
     if outfile:
         with open(outfile, "w") as inf:
             inf.write(naccess_out)
@@ -96,6 +95,51 @@ def run_naccess(
     return naccess_out
 
 
+def run_naccess_batch(
+    pdbs, mode, path=True, include_hetatms=False, path_to_ex=None, max_workers=None
+):
+    """Runs naccess on a collection of structures in parallel.
+
+    Notes
+    -----
+    Each structure is processed by `run_naccess` in a separate worker
+    process.
+
+    Parameters
+    ----------
+    pdbs : [str]
+        Paths to pdb files or pdb strings.
+    mode : str
+        Return mode of naccess. One of 'asa', 'rsa' or 'log'.
+    path : bool, optional
+        Indicates if the items in pdbs are paths or strings.
+    include_hetatms : bool, optional
+        If true, hetatms are included in the calculation.
+    path_to_ex : str or None
+        Path to the binary for naccess, if none then it is assumed
+        that the binary is available on the path as `naccess`.
+    max_workers : int or None
+        Maximum number of worker processes, defaults to the number of
+        processors on the machine.
+
+    Returns
+    -------
+    naccess_outs : [str]
+        naccess output file for given mode as a string, in the same order
+        as pdbs.
+    """
+    run = functools.partial(
+        run_naccess,
+        mode=mode,
+        path=path,
+        include_hetatms=include_hetatms,
+        path_to_ex=path_to_ex,
+    )
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        naccess_outs = list(executor.map(run, pdbs))
+    return naccess_outs
+
+
 def total_accessibility(in_rsa, path=True):
     """Parses rsa file for the total surface accessibility data.
 
@@ -122,8 +166,10 @@ def total_accessibility(in_rsa, path=True):
             rsa = inf.read()
     else:
         rsa = in_rsa[:]
+    # Only the last line is needed, so avoid splitting the whole file
+    last_line = rsa.rstrip("\r\n").rpartition("\n")[2]
     all_atoms, side_chains, main_chain, non_polar, polar = [
-        float(x) for x in rsa.splitlines()[-1].split()[1:]
+        float(x) for x in last_line.split()[1:]
     ]
     return all_atoms, side_chains, main_chain, non_polar, polar
 
@@ -156,9 +202,8 @@ def extract_residue_accessibility(in_rsa, path=True, get_total=False):
     else:
         rsa = in_rsa[:]
 
-    residue_list = [x for x in rsa.splitlines()]
     rel_solv_acc_all_atoms = [
-        float(x[22:28]) for x in residue_list if x[0:3] == "RES" or x[0:3] == "HEM"
+        float(x[22:28]) for x in rsa.splitlines() if x.startswith(("RES", "HEM"))
     ]
 
     if get_total:
@@ -3,6 +3,7 @@
 from collections import OrderedDict
 import itertools
 import pathlib
+import sys
 
 from .base_ampal import Atom
 from .assembly import AmpalContainer, Assembly
@@ -12,6 +13,65 @@ from .ligands import Ligand, LigandGroup
 from .amino_acids import standard_amino_acids
 from .data import PDB_ATOM_COLUMNS
 
+# Coordinate records make up most of a file and are checked for first
+_ATOM_RECORD_PREFIXES = ("ATOM  ", "HETATM")
+
+
+def _parse_atom_line(line):
+    """Extracts data from columns in ATOM/HETATM record.
+
+    Notes
+    -----
+    Pure Python equivalent of `_pdb_parser_c.parse_atom_line`, used if
+    the compiled extension is not available.
+    """
+    # int() and float() ignore surrounding whitespace, so numeric fields
+    # are not stripped
+    at_type = line[0:6].strip()  # 0
+    at_ser = int(line[6:11])  # 1
+    # Labels that are stored on every Atom or Monomer are interned so
+    # that repeats share one string object
+    at_name = sys.intern(line[12:16].strip())  # 2
+    alt_loc = line[16].strip()  # 3
+    res_name = sys.intern(line[17:20].strip())  # 4
+    chain_id = line[21].strip()  # 5
+    res_seq = int(line[22:26])  # 6
+    i_code = line[26].strip()  # 7
+    x = float(line[30:38])  # 8
+    y = float(line[38:46])  # 9
+    z = float(line[46:54])  # 10
+    occupancy = float(line[54:60])  # 11
+    _temp_factor = line[60:66].strip()
+    if _temp_factor:
+        temp_factor = float(_temp_factor)
+    else:
+        temp_factor = 0.0
+    element = sys.intern(line[76:78].strip())  # 13
+    charge = sys.intern(line[78:80].strip())  # 14
+    return (
+        at_type,
+        at_ser,
+        at_name,
+        alt_loc,
+        res_name,
+        chain_id,
+        res_seq,
+        i_code,
+        x,
+        y,
+        z,
+        occupancy,
+        temp_factor,
+        element,
+        charge,
+    )
+
+
+try:
+    from ._pdb_parser_c import parse_atom_line
+except ImportError:
+    parse_atom_line = _parse_atom_line
+
 
 def load_pdb(pdb, path=True, pdb_id="", ignore_end=False):
     """Converts a PDB file into an AMPAL object.
@@ -76,8 +136,9 @@ class PdbParser(object):
         This dictionary represents the parse tree of the PDB file.
         Each line of the structure is broken down into a key, the
         entry label, and a value, the data.
-    current_line : int
-        The line that is currently being parsed.
+    current_line : str
+        The last non-coordinate line that was parsed. ATOM and HETATM
+        records are passed directly to `proc_atom`.
     ignore_end : bool, optional
         If `false`, parsing of the file will stop when an "END"
         record is encountered.
@@ -104,29 +165,46 @@ class PdbParser(object):
         self.pdb_parse_tree = None
         self.current_line = None
         self.ignore_end = ignore_end
+        self._end_reached = False
+        self._chains_out_of_order = False
+        # Taken for each file so that changes to standard_amino_acids
+        # are seen
+        self._standard_aa_codes = frozenset(standard_amino_acids.values())
         self.parse_pdb_file()
 
     def parse_pdb_file(self):
         """Runs the PDB parser."""
         self.pdb_parse_tree = {"info": {}, "data": {self.state: {}}}
-        try:
-            for line in self.pdb_lines:
-                self.current_line = line
-                record_name = line[:6].strip()
-                if record_name in self.proc_functions:
-                    self.proc_functions[record_name]()
-                else:
-                    if record_name not in self.pdb_parse_tree["info"]:
-                        self.pdb_parse_tree["info"][record_name] = []
-                    self.pdb_parse_tree["info"][record_name].append(line)
-        except EOFError:
-            # Raised by END record
-            pass
+        self._end_reached = False
+        self._chains_out_of_order = False
+        for line in self.pdb_lines:
+            if line.startswith(_ATOM_RECORD_PREFIXES):
+                self.proc_atom(line)
+                continue
+            self.current_line = line
+            record_name = line[:6].strip()
+            if record_name in self.proc_functions:
+                self.proc_functions[record_name]()
+                if self._end_reached:
+                    # Set by END record
+                    break
+            else:
+                if record_name not in self.pdb_parse_tree["info"]:
+                    self.pdb_parse_tree["info"][record_name] = []
+                self.pdb_parse_tree["info"][record_name].append(line)
         return
 
-    def proc_atom(self):
-        """Processes an "ATOM" or "HETATM" record."""
-        atom_data = self.proc_line_coordinate(self.current_line)
+    def proc_atom(self, line=None):
+        """Processes an "ATOM" or "HETATM" record.
+
+        Parameters
+        ----------
+        line : str, optional
+            The record to process, defaults to `current_line`.
+        """
+        if line is None:
+            line = self.current_line
+        atom_data = self.proc_line_coordinate(line)
         (
             at_type,
             at_ser,
@@ -148,11 +226,15 @@ class PdbParser(object):
         a_state = self.pdb_parse_tree["data"][self.state]
         res_id = (res_seq, i_code)
         if chain_id not in a_state:
-            a_state[chain_id] = (set(), OrderedDict())
+            # Chains are only sorted when building the Assembly if they
+            # did not appear in the file in order
+            if a_state and chain_id < next(reversed(a_state)):
+                self._chains_out_of_order = True
+            a_state[chain_id] = (set(), {})
         if res_id not in a_state[chain_id][1]:
-            a_state[chain_id][1][res_id] = (set(), OrderedDict())
+            a_state[chain_id][1][res_id] = (set(), {})
         if at_type == "ATOM":
-            if res_name in standard_amino_acids.values():
+            if res_name in self._standard_aa_codes:
                 poly = "P"
             else:
                 poly = "N"
@@ -175,51 +257,17 @@ class PdbParser(object):
     def end(self):
         """Processes an "END" record."""
         if not self.ignore_end:
-            raise EOFError
-        else:
-            return
+            self._end_reached = True
+        return
 
     def proc_line_coordinate(self, line):
         """Extracts data from columns in ATOM/HETATM record."""
-        at_type = line[0:6].strip()  # 0
-        at_ser = int(line[6:11].strip())  # 1
-        at_name = line[12:16].strip()  # 2
-        alt_loc = line[16].strip()  # 3
-        res_name = line[17:20].strip()  # 4
-        chain_id = line[21].strip()  # 5
-        res_seq = int(line[22:26].strip())  # 6
-        i_code = line[26].strip()  # 7
-        x = float(line[30:38].strip())  # 8
-        y = float(line[38:46].strip())  # 9
-        z = float(line[46:54].strip())  # 10
-        occupancy = float(line[54:60].strip())  # 11
-        _temp_factor = line[60:66].strip()
-        if _temp_factor:
-            temp_factor = float(_temp_factor)
-        else:
-            temp_factor = 0.0
-        element = line[76:78].strip()  # 13
-        charge = line[78:80].strip()  # 14
+        atom_data = parse_atom_line(line)
+        at_name = atom_data[2]
         if at_name not in PDB_ATOM_COLUMNS:
             PDB_ATOM_COLUMNS[at_name] = line[12:16]
             self.new_labels = True
-        return (
-            at_type,
-            at_ser,
-            at_name,
-            alt_loc,
-            res_name,
-            chain_id,
-            res_seq,
-            i_code,
-            x,
-            y,
-            z,
-            occupancy,
-            temp_factor,
-            element,
-            charge,
-        )
+        return atom_data
 
     # Generate PDB from parse tree
     def make_ampal(self):
@@ -256,7 +304,10 @@ class PdbParser(object):
             ID given to `Assembly` that represents the state.
         """
         assembly = Assembly(assembly_id=state_id)
-        for _, chain in sorted(state_data.items()):
+        chains = state_data.items()
+        if self._chains_out_of_order:
+            chains = sorted(chains)
+        for _, chain in chains:
             assembly._molecules.append(self.proc_chain(chain, assembly))
         return assembly
 
@@ -265,7 +316,7 @@ class PdbParser(object):
 
         Parameters
         ----------
-        chain_info : (set, OrderedDict)
+        chain_info : (set, dict)
             Contains a set of chain labels and atom records.
         parent : ampal.Assembly
             `Assembly` used to assign `parent` on created
@@ -283,7 +334,7 @@ class PdbParser(object):
 
         polymer = False
         chain_labels, chain_data = chain_info
-        chain_label = list(chain_labels)[0]
+        chain_label = next(iter(chain_labels))
         monomer_types = {x[2] for x in chain_labels if x[2]}
         if ("P" in monomer_types) and ("N" in monomer_types):
             raise ValueError('Malformed PDB, multiple "ATOM" types in a single chain.')
@@ -307,7 +358,7 @@ class PdbParser(object):
             ligands = chain
 
         for residue in chain_data.values():
-            res_info = list(residue[0])[0]
+            res_info = next(iter(residue[0]))
             if res_info[0] == "ATOM":
                 chain._monomers.append(self.proc_monomer(residue, chain))
             elif res_info[0] == "HETATM":
@@ -336,7 +387,7 @@ class PdbParser(object):
 
         Parameters
         ----------
-        monomer_info : (set, OrderedDict)
+        monomer_info : (set, dict)
             Labels and data for a monomer.
         parent : ampal.Polymer
             `Polymer` used to assign `parent` on created
@@ -351,12 +402,12 @@ class PdbParser(object):
                 "multiple labels. {}".format(monomer_labels)
             )
         else:
-            monomer_label = list(monomer_labels)[0]
+            monomer_label = next(iter(monomer_labels))
         if mon_cls:
             monomer_class = mon_cls
             het = True
         elif monomer_label[0] == "ATOM":
-            if monomer_label[2] in standard_amino_acids.values():
+            if monomer_label[2] in self._standard_aa_codes:
                 monomer_class = Residue
             else:
                 monomer_class = Nucleotide
@@ -372,7 +423,7 @@ class PdbParser(object):
             parent=parent,
         )
         monomer.states = self.gen_states(monomer_data.values(), monomer)
-        monomer._active_state = sorted(monomer.states.keys())[0]
+        monomer._active_state = min(monomer.states)
         return monomer
 
     def gen_states(self, monomer_data, parent):
@@ -390,27 +441,26 @@ class PdbParser(object):
                 state = "A" if not atom[3] else atom[3]
                 if state not in states:
                     states[state] = OrderedDict()
+                # Positional arguments, in the order of Atom.__init__
                 states[state][atom[2]] = Atom(
-                    tuple(atom[8:11]),
+                    atom[8:11],
                     atom[13],
-                    atom_id=atom[1],
-                    res_label=atom[2],
-                    occupancy=atom[11],
-                    bfactor=atom[12],
-                    charge=atom[14],
-                    state=state,
-                    parent=parent,
+                    atom[1],
+                    atom[2],
+                    atom[11],
+                    atom[12],
+                    atom[14],
+                    state,
+                    parent,
                 )
 
         # This code is to check if there are alternate states and populate any
         # both states with the full complement of atoms
-        states_len = [(k, len(x)) for k, x in states.items()]
-        if (len(states) > 1) and (len(set([x[1] for x in states_len])) > 1):
+        if (len(states) > 1) and (len({len(x) for x in states.values()}) > 1):
+            reference_state = states[min(states)]
             for t_state, t_state_d in states.items():
                 new_s_dict = OrderedDict()
-                for k, v in states[
-                    sorted(states_len, key=lambda x: x[0])[0][0]
-                ].items():
+                for k, v in reference_state.items():
                     if k not in t_state_d:
                         c_atom = Atom(
                             v._vector,
@@ -433,14 +483,15 @@ class PdbParser(object):
     @staticmethod
     def check_for_non_canonical(residue):
         """Checks to see if the residue is non-canonical."""
-        res_label = list(residue[0])[0][2]
-        atom_labels = {
-            x[2] for x in itertools.chain(*residue[1].values())
-        }  # Used to find unnatural aas
-        if (all(x in atom_labels for x in ["N", "CA", "C", "O"])) and (
-            len(res_label) == 3
-        ):
-            return Residue, True
+        res_label = next(iter(residue[0]))[2]
+        if len(res_label) != 3:
+            return None
+        # Used to find unnatural aas, stops as soon as the backbone is found
+        missing_backbone = {"N", "CA", "C", "O"}
+        for atom in itertools.chain.from_iterable(residue[1].values()):
+            missing_backbone.discard(atom[2])
+            if not missing_backbone:
+                return Residue, True
         return None
 
 
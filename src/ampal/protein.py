@@ -1,6 +1,7 @@
 """AMPAL objects that represent protein."""
 
 from collections import OrderedDict
+import math
 import warnings
 
 import numpy
@@ -10,14 +11,14 @@ from ampal.pseudo_atoms import Primitive
 from ampal.analyse_protein import (
     make_primitive_extrapolate_ends,
     measure_torsion_angles,
-    residues_per_turn,
-    polymer_to_reference_axis_distances,
-    crick_angles,
-    alpha_angles,
+    _residues_per_turn,
+    _reference_axis_distances,
+    _crick_angles,
+    _alpha_angles,
     sequence_molecular_weight,
     sequence_molar_extinction_280,
     sequence_isoelectric_point,
-    measure_sidechain_torsion_angles,
+    _measure_sidechain_torsion_angles,
 )
 from ampal.interactions import (
     generate_covalent_bond_graph,
@@ -29,17 +30,21 @@ from .amino_acids import (
     get_aa_letter,
     ideal_backbone_bond_lengths,
     ideal_backbone_bond_angles,
+    standard_side_chain_atoms,
 )
 from .geometry import (
     Quaternion,
     unit_vector,
     dihedral,
     find_transformations,
-    distance,
     angle_between_vectors,
+    rotation_matrix,
+    cross_product,
 )
 from .ampal_warnings import MalformedPDBWarning
 
+_BACKBONE_ATOM_NAMES = frozenset(("N", "CA", "C", "O", "OXT"))
+
 
 def flat_list_to_polymer(atom_list, atom_group_s=4):
     """Takes a flat list of atomic coordinates and converts it to a `Polymer`.
@@ -66,7 +71,7 @@ def flat_list_to_polymer(atom_list, atom_group_s=4):
     atoms_coords = [
         atom_list[x : x + atom_group_s] for x in range(0, len(atom_list), atom_group_s)
     ]
-    atoms = [[Atom(x[0], x[1]) for x in zip(y, atom_elements)] for y in atoms_coords]
+    atoms = [list(map(Atom, y, atom_elements)) for y in atoms_coords]
     if atom_group_s == 5:
         monomers = [Residue(OrderedDict(zip(atom_labels, x)), "ALA") for x in atoms]
     elif atom_group_s == 4:
@@ -101,7 +106,7 @@ def flat_list_to_dummy_chain(atom_list, atom_group_s=1):
     atoms_coords = [
         atom_list[x : x + atom_group_s] for x in range(0, len(atom_list), atom_group_s)
     ]
-    atoms = [[Atom(x[0], x[1]) for x in zip(y, atom_elements)] for y in atoms_coords]
+    atoms = [list(map(Atom, y, atom_elements)) for y in atoms_coords]
     monomers = [Residue(OrderedDict(zip(atom_labels, x)), "DUM") for x in atoms]
     polymer = Polypeptide(monomers=monomers)
     return polymer
@@ -126,35 +131,82 @@ def align(target, mobile, target_i=0, mobile_i=0):
     mobile_i : int, optional
         Index of `Residue` in mobile to be aligned.
     """
-    # First, align N->CA vectors.
-    s1, e1, s2, e2 = [
-        x._vector
-        for x in [
-            mobile[mobile_i]["N"],
-            mobile[mobile_i]["CA"],
-            target[target_i]["N"],
-            target[target_i]["CA"],
-        ]
-    ]
+    # The two movements are composed into one transformation, tracked on
+    # the N, CA and C atoms of the mobile residue, so that every atom of
+    # mobile is only moved once.
+    mobile_start = numpy.array(
+        [mobile[mobile_i][atom]._vector for atom in ("N", "CA", "C")]
+    )
+    t_n, t_ca, t_c = [target[target_i][atom]._vector for atom in ("N", "CA", "C")]
+    # First, align N->CA vectors. Rotation first, then translation.
     translation, angle, axis, point = find_transformations(
-        s1, e1, s2, e2, radians=False
+        mobile_start[0], mobile_start[1], t_n, t_ca, radians=False
     )
-    # Rotation first, Then translation.
-    mobile.rotate(angle=angle, axis=axis, point=point, radians=False)
-    mobile.translate(vector=translation)
+    transformation = _rotation_about_axis(angle, axis, point)
+    transformation[:3, 3] += translation
+    m_n, m_ca, m_c = _transform_points(transformation, mobile_start)
     # Second, rotate about N->CA axis to align CA->C vectors.
-    angle = dihedral(
-        mobile[mobile_i]["C"],
-        mobile[mobile_i]["N"],
-        mobile[mobile_i]["CA"],
-        target[target_i]["C"],
-    )
-    axis = target[target_i]["CA"] - target[target_i]["N"]
-    point = target[target_i]["N"]._vector
-    mobile.rotate(angle=angle, axis=axis, point=point)
+    angle = dihedral(m_c, m_n, m_ca, t_c)
+    transformation = _rotation_about_axis(angle, t_ca - t_n, t_n) @ transformation
+    mobile._apply_transformation(transformation)
     return
 
 
+def _rotation_about_axis(angle, axis, point):
+    """Transformation matrix for a rotation of `angle` degrees about an axis.
+
+    Parameters
+    ----------
+    angle : float
+        Angle of rotation in degrees.
+    axis : numpy.array
+        Direction of the axis of rotation, need not be a unit vector.
+    point : numpy.array
+        Point that the axis passes through.
+
+    Returns
+    -------
+    transformation : numpy.array
+        (4 x 4) transformation matrix.
+    """
+    return rotation_matrix(numpy.deg2rad(angle), unit_vector(axis), point)
+
+
+def _transform_points(transformation, points):
+    """Applies a (4 x 4) transformation matrix to an (n x 3) array of points."""
+    return (points @ transformation[:3, :3].T) + transformation[:3, 3]
+
+
+def _angles_between_vectors(a, b):
+    """Angles in degrees between each pair of rows in two arrays of vectors.
+
+    Notes
+    -----
+    Vectorised form of `geometry.angle_between_vectors`, so the angle is
+    0.0 if either vector is very close to the origin.
+
+    Parameters
+    ----------
+    a : numpy.array
+        Array of shape (k, 3).
+    b : numpy.array
+        Array of shape (k, 3).
+
+    Returns
+    -------
+    angles : numpy.array
+        Array of shape (k,).
+    """
+    mag_a = numpy.linalg.norm(a, axis=1)
+    mag_b = numpy.linalg.norm(b, axis=1)
+    degenerate = (mag_a < 1e-7) | (mag_b < 1e-7)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        cos_angles = numpy.einsum("ij,ij->i", a, b) / (mag_a * mag_b)
+    angles = numpy.degrees(numpy.arccos(numpy.clip(cos_angles, -1.0, 1.0)))
+    angles[degenerate] = 0.0
+    return angles
+
+
 class Polypeptide(Polymer):
     """Container for `Residues`, inherits from `Polymer`.
 
@@ -217,8 +269,7 @@ class Polypeptide(Polymer):
 
     def __getitem__(self, item):
         if isinstance(item, str):
-            id_dict = {str(m.id): m for m in self._monomers}
-            return id_dict[item]
+            return self._monomers[self._monomer_position(item)]
         elif isinstance(item, int):
             return self._monomers[item]
         return Polypeptide(self._monomers[item], polymer_id=self.id)
@@ -249,25 +300,12 @@ class Polypeptide(Polymer):
         slice_polymer : Polymer
             Polymer containing the residue range specified by start-end
         """
-        # Create a dictionary mapping residue IDs to their positions.
-        id_to_position = {residue.id: i for i, residue in enumerate(self._monomers)}
-        # Create a list of all residue IDs to maintain the order.
-        ordered_ids = [residue.id for residue in self._monomers]
-
-        # Get the position of the start and end IDs.
-        start_pos = id_to_position.get(start)
-        end_pos = id_to_position.get(end) + 1
-
-        # Check if both start and end IDs are valid.
-        if start_pos is None or end_pos is None:
+        try:
+            start_pos = self._monomer_position(str(start))
+            end_pos = self._monomer_position(str(end)) + 1
+        except KeyError:
             raise ValueError("Start or end ID not found.")
-
-        # Slice the ordered_ids list to get the IDs in the range and then select the corresponding monomers.
-        selected_ids = ordered_ids[start_pos:end_pos]
-        selected_monomers = [self._monomers[id_to_position[id]] for id in selected_ids]
-
-        # Create and return a new Polypeptide from the selected monomers.
-        return Polypeptide(selected_monomers, self.id)
+        return Polypeptide(self._monomers[start_pos:end_pos], self.id)
 
     @property
     def backbone(self):
@@ -312,11 +350,10 @@ class Polypeptide(Polymer):
             self.parent.id.upper(), self.id
         )
         seq = self.sequence
-        split_seq = [
-            seq[i : i + max_line_length] for i in range(0, len(seq), max_line_length)
-        ]
-        for seq_part in split_seq:
-            fasta_str += "{0}\n".format(seq_part)
+        fasta_str += "".join(
+            seq[i : i + max_line_length] + "\n"
+            for i in range(0, len(seq), max_line_length)
+        )
         return fasta_str
 
     @property
@@ -346,6 +383,59 @@ class Polypeptide(Polymer):
         """Returns the isoelectric point of the `Assembly`."""
         return sequence_isoelectric_point(self.sequence)
 
+    def centroids(self):
+        """Calculates the centroid of every `Residue` in the `Polypeptide`.
+
+        Notes
+        -----
+        Equivalent to calling `Residue.centroid` on each `Residue`, but
+        the `Residues` are measured together.
+
+        Returns
+        -------
+        centroids : [numpy.array or None]
+            List has the same length as the `Polypeptide`. Element i is
+            the centroid of the i-th `Residue`, or `None` if it does not
+            have a CB atom.
+        """
+        centroids = [None] * len(self._monomers)
+        with_cb = []
+        coords = []
+        for i, residue in enumerate(self._monomers):
+            atoms = residue.atoms
+            if "CB" in atoms:
+                with_cb.append(i)
+                coords.extend((atoms["CA"]._vector, atoms["CB"]._vector))
+        if not with_cb:
+            return centroids
+        coords = numpy.array(coords, dtype=float).reshape(-1, 2, 3)
+        ca = coords[:, 0]
+        ca_cb = coords[:, 1] - ca
+        cb_lengths = numpy.sqrt(numpy.einsum("ij,ij->i", ca_cb, ca_cb))
+        for i, centroid in zip(
+            with_cb, ca + 3.0 * (ca_cb / cb_lengths[:, numpy.newaxis])
+        ):
+            centroids[i] = centroid
+        return centroids
+
+    def _backbone_coordinates(self):
+        """Array of the N, CA, C and O coordinates of each `Residue`.
+
+        Returns
+        -------
+        bb_coords : numpy.array
+            Array of shape (k, 4, 3) for a `Polypeptide` containing k
+            `Residues`.
+        """
+        bb_coords = numpy.array(
+            [
+                (r["N"]._vector, r["CA"]._vector, r["C"]._vector, r["O"]._vector)
+                for r in self._monomers
+            ],
+            dtype=float,
+        )
+        return bb_coords.reshape(-1, 4, 3)
+
     @property
     def backbone_bond_lengths(self):
         """Dictionary containing backbone bond lengths as lists of floats.
@@ -361,14 +451,14 @@ class Polypeptide(Polymer):
             is of length k-1 for a Polypeptide containing k Residues
             (C-N formed between successive `Residue` pairs).
         """
+        bb_coords = self._backbone_coordinates()
         bond_lengths = dict(
-            n_ca=[distance(r["N"], r["CA"]) for r in self.get_monomers(ligands=False)],
-            ca_c=[distance(r["CA"], r["C"]) for r in self.get_monomers(ligands=False)],
-            c_o=[distance(r["C"], r["O"]) for r in self.get_monomers(ligands=False)],
-            c_n=[
-                distance(r1["C"], r2["N"])
-                for r1, r2 in [(self[i], self[i + 1]) for i in range(len(self) - 1)]
-            ],
+            n_ca=numpy.linalg.norm(bb_coords[:, 1] - bb_coords[:, 0], axis=1).tolist(),
+            ca_c=numpy.linalg.norm(bb_coords[:, 2] - bb_coords[:, 1], axis=1).tolist(),
+            c_o=numpy.linalg.norm(bb_coords[:, 3] - bb_coords[:, 2], axis=1).tolist(),
+            c_n=numpy.linalg.norm(
+                bb_coords[1:, 0] - bb_coords[:-1, 2], axis=1
+            ).tolist(),
         )
         return bond_lengths
 
@@ -388,23 +478,15 @@ class Polypeptide(Polymer):
             angles are across the peptide bond, and are therefore formed
             between successive `Residue` pairs).
         """
+        bb_coords = self._backbone_coordinates()
+        n, ca, c, o = (bb_coords[:, i] for i in range(4))
         bond_angles = dict(
-            n_ca_c=[
-                angle_between_vectors(r["N"] - r["CA"], r["C"] - r["CA"])
-                for r in self.get_monomers(ligands=False)
-            ],
-            ca_c_o=[
-                angle_between_vectors(r["CA"] - r["C"], r["O"] - r["C"])
-                for r in self.get_monomers(ligands=False)
-            ],
-            ca_c_n=[
-                angle_between_vectors(r1["CA"] - r1["C"], r2["N"] - r1["C"])
-                for r1, r2 in [(self[i], self[i + 1]) for i in range(len(self) - 1)]
-            ],
-            c_n_ca=[
-                angle_between_vectors(r1["C"] - r2["N"], r2["CA"] - r2["N"])
-                for r1, r2 in [(self[i], self[i + 1]) for i in range(len(self) - 1)]
-            ],
+            n_ca_c=_angles_between_vectors(n - ca, c - ca).tolist(),
+            ca_c_o=_angles_between_vectors(ca - c, o - c).tolist(),
+            ca_c_n=_angles_between_vectors(
+                ca[:-1] - c[:-1], n[1:] - c[:-1]
+            ).tolist(),
+            c_n_ca=_angles_between_vectors(c[:-1] - n[1:], ca[1:] - n[1:]).tolist(),
         )
         return bond_angles
 
@@ -481,7 +563,7 @@ class Polypeptide(Polymer):
         p1 = r1_o[:]
         # rotate p1 by o_c_n_angle, about axis perpendicular to the
         # r1_ca, r1_c, r1_o plane, passing through r1_c.
-        axis = numpy.cross((r1_ca - r1_c), (r1_o - r1_c))
+        axis = cross_product((r1_ca - r1_c), (r1_o - r1_c))
         q = Quaternion.angle_and_axis(angle=o_c_n_angle, axis=axis)
         p1 = q.rotate_vector(v=p1, point=r1_c)
         # Ensure p1 is separated from r1_c by the correct distance.
@@ -491,31 +573,38 @@ class Polypeptide(Polymer):
         q = Quaternion.angle_and_axis(angle=(psi - measured_psi), axis=(r1_c - r1_ca))
         p1 = q.rotate_vector(v=p1, point=r1_c)
         r1["O"]._vector = q.rotate_vector(v=r1_o, point=r1_c)
+        # The movement of other is worked out on the backbone of its first
+        # residue and applied to all of its atoms at the end.
+        r2_start = numpy.array(
+            [other[0][x]._vector for x in ("N", "CA", "C")], dtype=float
+        )
         # translate other so that its first N atom is at p1
-        other.translate(vector=(p1 - other[0]["N"]._vector))
+        transformation = numpy.identity(4)
+        transformation[:3, 3] = p1 - r2_start[0]
+        r2_n, r2_ca, r2_c = _transform_points(transformation, r2_start)
         # rotate other so that c_n_ca angle is correct.
-        v1 = r1_c - other[0]["N"]._vector
-        v2 = other[0]["CA"]._vector - other[0]["N"]._vector
+        v1 = r1_c - r2_n
+        v2 = r2_ca - r2_n
         measured_c_n_ca = angle_between_vectors(v1, v2)
-        axis = numpy.cross(v1, v2)
-        other.rotate(
-            angle=(c_n_ca_angle - measured_c_n_ca),
-            axis=axis,
-            point=other[0]["N"]._vector,
+        axis = cross_product(v1, v2)
+        transformation = (
+            _rotation_about_axis(c_n_ca_angle - measured_c_n_ca, axis, r2_n)
+            @ transformation
         )
+        r2_n, r2_ca, r2_c = _transform_points(transformation, r2_start)
         # rotate other to obtain desired omega and phi values at the join
-        measured_omega = dihedral(r1["CA"], r1["C"], other[0]["N"], other[0]["CA"])
-        other.rotate(
-            angle=(omega - measured_omega),
-            axis=(other[0]["N"] - r1["C"]),
-            point=other[0]["N"]._vector,
+        measured_omega = dihedral(r1_ca, r1_c, r2_n, r2_ca)
+        transformation = (
+            _rotation_about_axis(omega - measured_omega, r2_n - r1_c, r2_n)
+            @ transformation
         )
-        measured_phi = dihedral(r1["C"], other[0]["N"], other[0]["CA"], other[0]["C"])
-        other.rotate(
-            angle=(phi - measured_phi),
-            axis=(other[0]["CA"] - other[0]["N"]),
-            point=other[0]["CA"]._vector,
+        r2_n, r2_ca, r2_c = _transform_points(transformation, r2_start)
+        measured_phi = dihedral(r1_c, r2_n, r2_ca, r2_c)
+        transformation = (
+            _rotation_about_axis(phi - measured_phi, r2_ca - r2_n, r2_ca)
+            @ transformation
         )
+        other._apply_transformation(transformation)
         self.extend(other)
         if relabel:
             self.relabel_all()
@@ -595,49 +684,58 @@ class Polypeptide(Polymer):
         p1 = r1_ca[:]
         # rotate p1 by c_n_ca_angle, about axis perpendicular to the
         # r1_n, r1_ca, r1_c plane, passing through r1_ca.
-        axis = numpy.cross((r1_ca - r1_n), (r1_c - r1_n))
+        axis = cross_product((r1_ca - r1_n), (r1_c - r1_n))
         q = Quaternion.angle_and_axis(angle=c_n_ca_angle, axis=axis)
         p1 = q.rotate_vector(v=p1, point=r1_n)
         # Ensure p1 is separated from r1_n by the correct distance.
         p1 = r1_n + (c_n_length * unit_vector(p1 - r1_n))
+        # The movement of other is worked out on the backbone of its final
+        # residue and applied to all of its atoms at the end.
+        r2_start = numpy.array(
+            [other[-1][x]._vector for x in ("N", "CA", "C", "O")], dtype=float
+        )
         # translate other so that its final C atom is at p1
-        other.translate(vector=(p1 - other[-1]["C"]._vector))
+        transformation = numpy.identity(4)
+        transformation[:3, 3] = p1 - r2_start[2]
+        r2_n, r2_ca, r2_c, r2_o = _transform_points(transformation, r2_start)
         # Force CA-C=O-N to be in a plane, and fix O=C-N angle accordingly
-        measured_dihedral = dihedral(
-            other[-1]["CA"], other[-1]["C"], other[-1]["O"], r1["N"]
-        )
+        measured_dihedral = dihedral(r2_ca, r2_c, r2_o, r1_n)
         desired_dihedral = 180.0
-        axis = other[-1]["O"] - other[-1]["C"]
-        other.rotate(
-            angle=(measured_dihedral - desired_dihedral),
-            axis=axis,
-            point=other[-1]["C"]._vector,
-        )
-        axis = numpy.cross(other[-1]["O"] - other[-1]["C"], r1["N"] - other[-1]["C"])
-        measured_o_c_n = angle_between_vectors(
-            other[-1]["O"] - other[-1]["C"], r1["N"] - other[-1]["C"]
+        transformation = (
+            _rotation_about_axis(
+                measured_dihedral - desired_dihedral, r2_o - r2_c, r2_c
+            )
+            @ transformation
         )
-        other.rotate(
-            angle=(measured_o_c_n - o_c_n_angle),
-            axis=axis,
-            point=other[-1]["C"]._vector,
+        r2_n, r2_ca, r2_c, r2_o = _transform_points(transformation, r2_start)
+        axis = cross_product(r2_o - r2_c, r1_n - r2_c)
+        measured_o_c_n = angle_between_vectors(r2_o - r2_c, r1_n - r2_c)
+        transformation = (
+            _rotation_about_axis(measured_o_c_n - o_c_n_angle, axis, r2_c)
+            @ transformation
         )
+        r2_n, r2_ca, r2_c, r2_o = _transform_points(transformation, r2_start)
         # rotate other to obtain desired phi, omega, psi values at the join.
-        measured_phi = dihedral(other[-1]["C"], r1["N"], r1["CA"], r1["C"])
-        other.rotate(angle=(phi - measured_phi), axis=(r1_n - r1_ca), point=r1_ca)
-        measured_omega = dihedral(other[-1]["CA"], other[-1]["C"], r1["N"], r1["CA"])
-        other.rotate(
-            angle=(measured_omega - omega), axis=(r1["N"] - other[-1]["C"]), point=r1_n
+        measured_phi = dihedral(r2_c, r1_n, r1_ca, r1_c)
+        transformation = (
+            _rotation_about_axis(phi - measured_phi, r1_n - r1_ca, r1_ca)
+            @ transformation
         )
-        measured_psi = dihedral(
-            other[-1]["N"], other[-1]["CA"], other[-1]["C"], r1["N"]
+        r2_n, r2_ca, r2_c, r2_o = _transform_points(transformation, r2_start)
+        measured_omega = dihedral(r2_ca, r2_c, r1_n, r1_ca)
+        transformation = (
+            _rotation_about_axis(measured_omega - omega, r1_n - r2_c, r1_n)
+            @ transformation
         )
-        other.rotate(
-            angle=-(measured_psi - psi),
-            axis=(other[-1]["CA"] - other[-1]["C"]),
-            point=other[-1]["CA"]._vector,
+        r2_n, r2_ca, r2_c, r2_o = _transform_points(transformation, r2_start)
+        measured_psi = dihedral(r2_n, r2_ca, r2_c, r1_n)
+        transformation = (
+            _rotation_about_axis(-(measured_psi - psi), r2_ca - r2_c, r2_ca)
+            @ transformation
         )
+        other._apply_transformation(transformation)
         self._monomers = other._monomers + self._monomers
+        self._clear_id_index()
         if relabel:
             self.relabel_all()
         self.tags["assigned_ff"] = False
@@ -652,26 +750,22 @@ class Polypeptide(Polymer):
             If `True` the tag will be run even if `Residues` are
             already tagged.
         """
-        chi_tagged = ["chi_angles" in x.tags.keys() for x in self._monomers]
-        rot_tagged = ["rotamers" in x.tags.keys() for x in self._monomers]
-        if (not all(chi_tagged)) or (not all(rot_tagged)) or force:
+        if force or not all(
+            ("chi_angles" in x.tags) and ("rotamers" in x.tags) for x in self._monomers
+        ):
+            with_rotamers = []
             for monomer in self._monomers:
                 if monomer.mol_letter == "G" or monomer.mol_letter == "A":
                     monomer.tags["rotamers"] = [0]
                     monomer.tags["chi_angles"] = None
                 else:
-                    chi_angles_rotamer = measure_sidechain_torsion_angles(
-                        monomer, verbose=False
-                    )
-                    if chi_angles_rotamer:
-                        chi_angles, rotamer = chi_angles_rotamer
-                        monomer.tags["rotamers"] = rotamer
-                        monomer.tags["chi_angles"] = chi_angles
-                    # Rotamer not found: either residue does not have rotamers or
-                    # it is not a common residue
-                    else:
-                        monomer.tags["rotamers"] = None
-                        monomer.tags["chi_angles"] = None
+                    with_rotamers.append(monomer)
+            sidechain_torsion_angles = _measure_sidechain_torsion_angles(with_rotamers)
+            for monomer, (chi_angles, rotamer) in zip(
+                with_rotamers, sidechain_torsion_angles
+            ):
+                monomer.tags["rotamers"] = rotamer
+                monomer.tags["chi_angles"] = chi_angles
         return
 
     def tag_torsion_angles(self, force=False):
@@ -683,8 +777,7 @@ class Polypeptide(Polymer):
             If `True` the tag will be run even if `Residues` are
             already tagged.
         """
-        tagged = ["omega" in x.tags.keys() for x in self._monomers]
-        if (not all(tagged)) or force:
+        if force or not all("omega" in x.tags for x in self._monomers):
             tas = measure_torsion_angles(self._monomers)
             for monomer, (omega, phi, psi) in zip(self._monomers, tas):
                 monomer.tags["omega"] = omega
@@ -720,34 +813,43 @@ class Polypeptide(Polymer):
         reference_axis_name : str, optional
             Used to name the keys in tags at `Polypeptide` and `Residue` level.
         """
-        tagged = ["rise_per_residue" in x.tags.keys() for x in self._monomers]
-        if (not all(tagged)) or force:
+        # The CA coordinates and the primitive are gathered once and shared
+        # by all of the measurements.
+        cas = None
+        prim_cas = None
+        if force or not all("rise_per_residue" in x.tags for x in self._monomers):
             # Assign tags None if Polymer is too short to have a primitive.
             if len(self) < 7:
                 rprs = [None] * len(self)
                 rocs = [None] * len(self)
                 rpts = [None] * len(self)
             else:
-                rprs = self.rise_per_residue()
-                rocs = self.radii_of_curvature()
-                rpts = residues_per_turn(self)
+                primitive = self.primitive
+                cas = self.get_reference_coords()
+                prim_cas = primitive.coordinates
+                rprs = primitive.rise_per_residue()
+                rocs = primitive.radii_of_curvature()
+                rpts = _residues_per_turn(cas, prim_cas)
             for monomer, rpr, roc, rpt in zip(self._monomers, rprs, rocs, rpts):
                 monomer.tags["rise_per_residue"] = rpr
                 monomer.tags["radius_of_curvature"] = roc
                 monomer.tags["residues_per_turn"] = rpt
         # Functions that require a reference_axis.
         if (reference_axis is not None) and (len(reference_axis) == len(self)):
-            # Set up arguments to pass to functions.
-            ref_axis_args = dict(
-                p=self,
-                reference_axis=reference_axis,
-                tag=True,
-                reference_axis_name=reference_axis_name,
-            )
-            # Run the functions.
-            polymer_to_reference_axis_distances(**ref_axis_args)
-            crick_angles(**ref_axis_args)
-            alpha_angles(**ref_axis_args)
+            if prim_cas is None:
+                cas = self.get_reference_coords()
+                prim_cas = self.primitive.coordinates
+            ref_points = reference_axis.coordinates
+            ref_axis_tags = [
+                ("distance_to_{0}", _reference_axis_distances(prim_cas, ref_points)),
+                ("crick_angle_{0}", _crick_angles(cas, prim_cas, ref_points)),
+                ("alpha_angle_{0}", _alpha_angles(prim_cas, ref_points)),
+            ]
+            self.tags[reference_axis_name] = reference_axis
+            for tag_name, values in ref_axis_tags:
+                monomer_tag_name = tag_name.format(reference_axis_name)
+                for monomer, value in zip(self._monomers, values):
+                    monomer.tags[monomer_tag_name] = value
         return
 
     def valid_backbone_bond_lengths(self, atol=0.1):
@@ -769,27 +871,15 @@ class Polypeptide(Polymer):
             away from ideal backbone bond lengths.
         """
         bond_lengths = self.backbone_bond_lengths
-        a1 = numpy.allclose(
-            bond_lengths["n_ca"],
-            [ideal_backbone_bond_lengths["n_ca"]] * len(self),
-            atol=atol,
-        )
-        a2 = numpy.allclose(
-            bond_lengths["ca_c"],
-            [ideal_backbone_bond_lengths["ca_c"]] * len(self),
-            atol=atol,
+        bond_types = ["n_ca", "ca_c", "c_o", "c_n"]
+        measured = numpy.concatenate([bond_lengths[x] for x in bond_types])
+        ideal = numpy.concatenate(
+            [
+                numpy.full(len(bond_lengths[x]), ideal_backbone_bond_lengths[x])
+                for x in bond_types
+            ]
         )
-        a3 = numpy.allclose(
-            bond_lengths["c_o"],
-            [ideal_backbone_bond_lengths["c_o"]] * len(self),
-            atol=atol,
-        )
-        a4 = numpy.allclose(
-            bond_lengths["c_n"],
-            [ideal_backbone_bond_lengths["c_n"]] * (len(self) - 1),
-            atol=atol,
-        )
-        return all([a1, a2, a3, a4])
+        return numpy.allclose(measured, ideal, atol=atol)
 
     def valid_backbone_bond_angles(self, atol=20):
         """True if all backbone bond angles are within atol degrees of their expected values.
@@ -810,24 +900,26 @@ class Polypeptide(Polymer):
             away from ideal backbone bond angles.
         """
         bond_angles = self.backbone_bond_angles
-        omegas = [x[0] for x in measure_torsion_angles(self)]
-        trans = [
-            "trans" if (omega is None) or (abs(omega) >= 90) else "cis"
-            for omega in omegas
-        ]
-        ideal_n_ca_c = [ideal_backbone_bond_angles[x]["n_ca_c"] for x in trans]
-        ideal_ca_c_o = [
-            ideal_backbone_bond_angles[trans[i + 1]]["ca_c_o"]
-            for i in range(len(trans) - 1)
-        ]
-        ideal_ca_c_o.append(ideal_backbone_bond_angles["trans"]["ca_c_o"])
-        ideal_ca_c_n = [ideal_backbone_bond_angles[x]["ca_c_n"] for x in trans[1:]]
-        ideal_c_n_ca = [ideal_backbone_bond_angles[x]["c_n_ca"] for x in trans[1:]]
-        a1 = numpy.allclose(bond_angles["n_ca_c"], [ideal_n_ca_c], atol=atol)
-        a2 = numpy.allclose(bond_angles["ca_c_o"], [ideal_ca_c_o], atol=atol)
-        a3 = numpy.allclose(bond_angles["ca_c_n"], [ideal_ca_c_n], atol=atol)
-        a4 = numpy.allclose(bond_angles["c_n_ca"], [ideal_c_n_ca], atol=atol)
-        return all([a1, a2, a3, a4])
+        omegas = numpy.array(
+            [x[0] for x in measure_torsion_angles(self)], dtype=float
+        )
+        # Undefined omegas are nan, and are treated as trans
+        is_trans = ~(numpy.abs(omegas) < 90)
+        trans_angles = ideal_backbone_bond_angles["trans"]
+        cis_angles = ideal_backbone_bond_angles["cis"]
+        measured = numpy.concatenate(
+            [bond_angles[x] for x in ["n_ca_c", "ca_c_o", "ca_c_n", "c_n_ca"]]
+        )
+        ideal = numpy.concatenate(
+            [
+                numpy.where(is_trans, trans_angles["n_ca_c"], cis_angles["n_ca_c"]),
+                numpy.where(is_trans[1:], trans_angles["ca_c_o"], cis_angles["ca_c_o"]),
+                [trans_angles["ca_c_o"]],
+                numpy.where(is_trans[1:], trans_angles["ca_c_n"], cis_angles["ca_c_n"]),
+                numpy.where(is_trans[1:], trans_angles["c_n_ca"], cis_angles["c_n_ca"]),
+            ]
+        )
+        return numpy.allclose(measured, ideal, atol=atol)
 
 
 class Residue(Monomer):
@@ -937,9 +1029,7 @@ class Residue(Monomer):
                 ]
             )
         except KeyError:
-            missing_atoms = filter(
-                lambda x: x not in self.atoms.keys(), ("N", "CA", "C", "O")
-            )
+            missing_atoms = [x for x in ("N", "CA", "C", "O") if x not in self.atoms]
             raise KeyError(
                 "Error in residue {} {} {}, missing ({}) atoms. "
                 "`atoms` must be an `OrderedDict` with coordinates "
@@ -998,12 +1088,23 @@ class Residue(Monomer):
 
         Notes
         -----
-        Returns empty list for glycine.
+        Returns empty list for glycine. For standard amino acids with
+        exactly the expected heavy atoms, the side chain is taken from
+        `standard_side_chain_atoms`, otherwise it is found by breaking
+        the covalent bond graph of the `Residue`.
 
         Returns
         -------
         side_chain_atoms: list(`Atoms`)
         """
+        atoms = self.atoms
+        side_chain_names = standard_side_chain_atoms.get(self.mol_code)
+        if (
+            side_chain_names is not None
+            and "CA" in atoms
+            and (atoms.keys() - _BACKBONE_ATOM_NAMES) == set(side_chain_names)
+        ):
+            return [atoms[name] for name in side_chain_names]
         side_chain_atoms = []
         if self.mol_code != "GLY":
             covalent_bond_graph = generate_covalent_bond_graph(
@@ -1026,7 +1127,7 @@ class Residue(Monomer):
                 warning_message = "Malformed PDB for Residue {0}: {1}.".format(
                     self.id, self
                 )
-                if "CB" in self.atoms.keys():
+                if "CB" in self.atoms:
                     side_chain_atoms.append(self["CB"])
                     warning_message += " Side-chain is just the CB atom."
                 else:
@@ -1056,8 +1157,19 @@ class Residue(Monomer):
            Biol return., **252**, 709-720.
         """
         if "CB" in self.atoms:
-            cb_unit_vector = unit_vector(self["CB"]._vector - self["CA"]._vector)
-            return self["CA"]._vector + (3.0 * cb_unit_vector)
+            # Worked through with floats, as numpy call overhead dominates
+            # for a single 3-vector
+            ca_x, ca_y, ca_z = self.atoms["CA"]._vector.tolist()
+            cb_x, cb_y, cb_z = self.atoms["CB"]._vector.tolist()
+            d_x, d_y, d_z = cb_x - ca_x, cb_y - ca_y, cb_z - ca_z
+            cb_length = math.sqrt(d_x * d_x + d_y * d_y + d_z * d_z)
+            return numpy.array(
+                (
+                    ca_x + 3.0 * (d_x / cb_length),
+                    ca_y + 3.0 * (d_y / cb_length),
+                    ca_z + 3.0 * (d_z / cb_length),
+                )
+            )
         return None
 
 
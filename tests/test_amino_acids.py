@@ -56,6 +56,24 @@ class AALetterTestCase(unittest.TestCase):
         self.assertEqual(amino_acids.get_aa_letter('ALA'), 'A')
         self.assertEqual(amino_acids.get_aa_letter('TYR'), 'Y')
 
+    def test_aa_letter_after_update(self):
+        """Changes to standard_amino_acids are seen by get_aa_letter."""
+        original = dict(amino_acids.standard_amino_acids)
+        self.assertEqual(amino_acids.get_aa_letter('CYS'), 'C')
+        self.assertEqual(amino_acids.get_aa_letter('SEC'), 'X')
+        try:
+            amino_acids.standard_amino_acids['U'] = 'SEC'
+            self.assertEqual(amino_acids.get_aa_letter('SEC'), 'U')
+            amino_acids.standard_amino_acids['C'] = 'CSO'
+            self.assertEqual(amino_acids.get_aa_letter('CSO'), 'C')
+            self.assertEqual(amino_acids.get_aa_letter('CYS'), 'X')
+            del amino_acids.standard_amino_acids['U']
+            self.assertEqual(amino_acids.get_aa_letter('SEC'), 'X')
+        finally:
+            amino_acids.standard_amino_acids.clear()
+            amino_acids.standard_amino_acids.update(original)
+        self.assertEqual(amino_acids.get_aa_letter('CYS'), 'C')
+
 
 class AminoAcidDictTestCase(unittest.TestCase):
     """Tests amino_acids.tools_amino_acid_dict"""
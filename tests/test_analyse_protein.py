@@ -68,4 +68,63 @@ class RisePerResidueTestCase(unittest.TestCase):
         self.assertAlmostEqual(self.rprs[13], 1.4341967)
 
 
+class MeasureTorsionAnglesTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tas = analyse_protein.measure_torsion_angles(_test_polypeptide)
+
+    def test_measure_torsion_angles_length(self):
+        self.assertEqual(len(self.tas), len(_test_polypeptide))
+
+    def test_measure_torsion_angles_none_values(self):
+        self.assertEqual(self.tas[0][:2], (None, None))
+        self.assertIsNone(self.tas[-1][2])
+
+    def test_measure_torsion_angles_matches_dihedral(self):
+        for i in range(1, len(_test_polypeptide) - 1):
+            r1, r2, r3 = _test_polypeptide[i - 1:i + 2]
+            expected = (
+                ampal.geometry.dihedral(r1['CA'], r1['C'], r2['N'], r2['CA']),
+                ampal.geometry.dihedral(r1['C'], r2['N'], r2['CA'], r2['C']),
+                ampal.geometry.dihedral(r2['N'], r2['CA'], r2['C'], r3['N']))
+            for angle, expected_angle in zip(self.tas[i], expected):
+                self.assertAlmostEqual(angle, expected_angle)
+
+
+class SidechainTorsionAnglesTestCase(unittest.TestCase):
+    def test_tag_sidechain_dihedrals_matches_residue_measurement(self):
+        _test_polypeptide.tag_sidechain_dihedrals(force=True)
+        for residue in _test_polypeptide:
+            if residue.mol_letter in ('G', 'A'):
+                continue
+            chi_angles, rotamers = (
+                analyse_protein.measure_sidechain_torsion_angles(
+                    residue, verbose=False))
+            self.assertEqual(residue.tags['rotamers'], rotamers)
+            for angle, expected_angle in zip(
+                    residue.tags['chi_angles'], chi_angles):
+                self.assertAlmostEqual(angle, expected_angle)
+
+
+class ReferenceAxisTestCase(unittest.TestCase):
+    def test_tag_ca_geometry_matches_reference_axis_functions(self):
+        assembly = ampal.load_pdb(_test_file)
+        polypeptide = assembly[0]
+        reference_axis = assembly[1].primitive
+        polypeptide.tag_ca_geometry(
+            force=True, reference_axis=reference_axis,
+            reference_axis_name='axis')
+        self.assertIs(polypeptide.tags['axis'], reference_axis)
+        measurements = [
+            ('distance_to_axis',
+             analyse_protein.polymer_to_reference_axis_distances),
+            ('crick_angle_axis', analyse_protein.crick_angles),
+            ('alpha_angle_axis', analyse_protein.alpha_angles),
+        ]
+        for tag_name, measure in measurements:
+            values = measure(polypeptide, reference_axis, tag=False)
+            self.assertEqual(
+                [residue.tags[tag_name] for residue in polypeptide], values)
+
+
 __author__ = 'Jack W. Heal'
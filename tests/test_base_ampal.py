@@ -1,9 +1,13 @@
 """Test core functionality found in base_ampal."""
 
 from collections import Counter
+import copy
 import pathlib
+import pickle
 import unittest
 
+import numpy
+
 import ampal
 
 TEST_FILE_FOLDER = pathlib.Path(__file__).parent / 'testing_files'
@@ -53,5 +57,124 @@ class PDBWriterTestCase(unittest.TestCase):
         self.pdb_check(test_file_path)
 
 
+class TransformationTestCase(unittest.TestCase):
+    """Tests for rotating and translating AMPAL objects."""
+
+    def setUp(self):
+        self.structure = ampal.load_pdb(str(TEST_FILE_FOLDER / '3qy1.pdb'))
+
+    def test_rotate_matches_atom_rotate(self):
+        """Rotating a structure matches rotating each atom in turn."""
+        reference = copy.deepcopy(self.structure)
+        self.structure.rotate(37.0, [1, 2, 3], point=[4, 5, 6])
+        for atom in reference.get_atoms(inc_alt_states=True):
+            atom.rotate(37.0, [1, 2, 3], point=[4, 5, 6])
+        for rotated, expected in zip(
+                self.structure.get_atoms(inc_alt_states=True),
+                reference.get_atoms(inc_alt_states=True)):
+            self.assertTrue(numpy.allclose(rotated.array, expected.array))
+
+    def test_rotate_then_translate(self):
+        """Atoms can be moved independently after a rotation."""
+        self.structure.rotate(90.0, [0, 0, 1])
+        atom_a, atom_b = list(self.structure.get_atoms())[:2]
+        self.assertIsNone(atom_a._vector.base)
+        before = atom_b.array.copy()
+        atom_a.translate([1.0, 0.0, 0.0])
+        self.assertTrue(numpy.array_equal(atom_b.array, before))
+
+
+class PolymerIdLookupTestCase(unittest.TestCase):
+    """Tests for looking up monomers in a Polymer by id."""
+
+    def setUp(self):
+        self.polypeptide = ampal.load_pdb(
+            str(TEST_FILE_FOLDER / '3qy1.pdb'))['A']
+
+    def test_lookup_after_changes(self):
+        """Lookups by id are correct after the polymer is modified."""
+        monomer_id = self.polypeptide[5].id
+        self.assertIs(self.polypeptide[monomer_id], self.polypeptide[5])
+        self.polypeptide._monomers.pop(0)
+        self.assertIs(self.polypeptide[monomer_id], self.polypeptide[4])
+        self.polypeptide.relabel_monomers()
+        self.assertIs(self.polypeptide['1'], self.polypeptide[0])
+        with self.assertRaises(KeyError):
+            self.polypeptide[monomer_id + 'X']
+
+    def test_duplicate_ids(self):
+        """The last Monomer with an id is found, whatever was looked up before."""
+        head = copy.deepcopy(self.polypeptide[:3])
+        tail = copy.deepcopy(self.polypeptide[:3])
+        monomer_id = head[0].id
+        self.assertIs(head[monomer_id], head[0])
+        head.extend(tail)
+        self.assertIs(head[monomer_id], head[3])
+        head._monomers.append(copy.deepcopy(self.polypeptide[0]))
+        self.assertIs(head[monomer_id], head[6])
+        joined = copy.deepcopy(self.polypeptide[:3])
+        self.assertIs(joined[monomer_id], joined[0])
+        joined.c_join(copy.deepcopy(self.polypeptide[:3]), relabel=False)
+        self.assertIs(joined[monomer_id], joined[3])
+
+    def test_get_slice_from_res_id(self):
+        start, end = self.polypeptide[2].id, self.polypeptide[10].id
+        self.assertEqual(
+            self.polypeptide.get_slice_from_res_id(start, end).sequence,
+            self.polypeptide[2:11].sequence)
+        with self.assertRaises(ValueError):
+            self.polypeptide.get_slice_from_res_id(start, 'X')
+
+
+class ResidueCentroidTestCase(unittest.TestCase):
+    """Tests for the centroid of a Residue."""
+
+    def test_centroid(self):
+        polypeptide = ampal.load_pdb(str(TEST_FILE_FOLDER / '3qy1.pdb'))['A']
+        for residue in polypeptide:
+            if 'CB' not in residue.atoms:
+                self.assertIsNone(residue.centroid)
+                continue
+            ca, cb = residue['CA'].array, residue['CB'].array
+            expected = ca + 3.0 * (cb - ca) / numpy.linalg.norm(cb - ca)
+            self.assertTrue(numpy.allclose(residue.centroid, expected))
+
+    def test_centroids(self):
+        polypeptide = ampal.load_pdb(str(TEST_FILE_FOLDER / '3qy1.pdb'))['A']
+        centroids = polypeptide.centroids()
+        self.assertEqual(len(centroids), len(polypeptide))
+        for residue, centroid in zip(polypeptide, centroids):
+            if residue.centroid is None:
+                self.assertIsNone(centroid)
+            else:
+                self.assertTrue(numpy.allclose(centroid, residue.centroid))
+
+
+class PickleCompatibilityTestCase(unittest.TestCase):
+    """Tests for loading pickles made by earlier releases."""
+
+    def setUp(self):
+        with open(str(TEST_FILE_FOLDER / 'baseline_3qy1_fragment.pickle'),
+                  'rb') as inf:
+            self.assembly = pickle.load(inf)
+
+    def test_atoms(self):
+        polypeptide = self.assembly[0]
+        self.assertEqual(polypeptide.sequence, 'DIDT')
+        atom = polypeptide[0]['N']
+        self.assertIs(atom.parent, polypeptide[0])
+        self.assertTrue(numpy.allclose(
+            atom._vector, [14.714, -30.168, -26.423]))
+        self.assertEqual(atom.tags['bfactor'], 60.61)
+        self.assertEqual(
+            pickle.loads(pickle.dumps(self.assembly)).pdb, self.assembly.pdb)
+
+    def test_monomer_lookup(self):
+        polypeptide = self.assembly[0]
+        self.assertIs(polypeptide['4'], polypeptide[1])
+        self.assertEqual(
+            polypeptide.get_slice_from_res_id('4', '6').sequence, 'IDT')
+
+
 if __name__ == '__main__':
     unittest.main()
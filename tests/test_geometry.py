@@ -195,6 +195,30 @@ class RotationMatrixTestCase(unittest.TestCase):
             [1, 0, 0, 0])), numpy.array([0, 1, 0, 0]))
         self.assertTrue(aet)
 
+    def test_rotation_about_point(self):
+        point = numpy.array([1.0, 2.0, 3.0])
+        r_matrix = geometry.rotation_matrix(
+            1.3, geometry.unit_vector([1, -2, 0.5]), point)
+        self.assertTrue(numpy.allclose(
+            numpy.dot(r_matrix[:3, :3], r_matrix[:3, :3].T), numpy.identity(3)))
+        self.assertTrue(numpy.allclose(
+            numpy.dot(r_matrix, numpy.append(point, 1.0))[:3], point))
+
+
+class CrossProductTestCase(unittest.TestCase):
+    """Tests for tools.geometry.cross_product"""
+
+    @given(tuples(
+        lists(floats(min_value=-1e10, max_value=1e10, allow_nan=False,
+                     allow_infinity=False), min_size=3, max_size=3),
+        lists(floats(min_value=-1e10, max_value=1e10, allow_nan=False,
+                     allow_infinity=False), min_size=3, max_size=3)))
+    @settings(max_examples=1000)
+    def test_matches_numpy(self, vectors):
+        a, b = vectors
+        self.assertTrue(numpy.array_equal(
+            geometry.cross_product(a, b), numpy.cross(a, b)))
+
 
 class ClosestDistanceTestCase(unittest.TestCase):
     """Tests for tools.tool_geometry.closest_distance"""
@@ -475,6 +499,22 @@ class QuaternionTestCase(unittest.TestCase):
         at = numpy.allclose(q_results, v_results)
         self.assertTrue(at)
 
+    def test_as_matrix(self):
+        """as_matrix should rotate vectors in the same way as rotate_vector """
+        rot_quats = [geometry.Quaternion.angle_and_axis(
+            a, v) for a, v in zip(self.angles, self.vectors)]
+        test_vectors = [numpy.random.rand(3) for _ in range(len(self.angles))]
+        actual = [numpy.dot(q.as_matrix(), v)
+                  for q, v in zip(rot_quats, test_vectors)]
+        desired = [q.rotate_vector(v) for q, v in zip(rot_quats, test_vectors)]
+        at = numpy.allclose(actual, desired)
+        self.assertTrue(at)
+
+    def test_as_matrix_not_rotation(self):
+        """as_matrix is only defined for rotation quaternions """
+        with self.assertRaises(AttributeError):
+            self.quats[0].as_matrix()
+
 
 class AxisTestCase(unittest.TestCase):
     """Tests for tools.geometry.Axis class"""
@@ -0,0 +1,64 @@
+import itertools
+import unittest
+import pathlib
+
+import ampal
+from ampal.interactions import (
+    covalent_bonds,
+    find_covalent_bonds,
+    generate_covalent_bond_graph,
+    generate_bond_subgraphs_from_break,
+)
+
+TEST_FILE_FOLDER = pathlib.Path(__file__).parent / 'testing_files'
+
+
+class CovalentBondTestCase(unittest.TestCase):
+    """Tests for covalent bond detection and the bond graph."""
+
+    def setUp(self):
+        self.pdb = ampal.load_pdb(str(TEST_FILE_FOLDER / '3qy1.pdb'))
+        self.chain = self.pdb['A']
+
+    def test_no_duplicate_bonds(self):
+        bonds = find_covalent_bonds(self.chain, tag=False)
+        pairs = [frozenset((b.a, b.b)) for b in bonds]
+        self.assertEqual(len(pairs), len(set(pairs)))
+
+    def test_matches_exhaustive_search(self):
+        fragment = self.chain[10:30]
+        bonds = find_covalent_bonds(fragment, tag=False)
+        expected = covalent_bonds(
+            itertools.combinations(fragment.get_atoms(), 2))
+        self.assertEqual(
+            {frozenset((b.a, b.b)) for b in bonds},
+            {frozenset((b.a, b.b)) for b in expected})
+
+    def test_backbone_bonded(self):
+        residue = self.chain[5]
+        bonds = find_covalent_bonds(residue)
+        self.assertIn(residue['CA'], residue['N'].tags['covalent_bonds'])
+        self.assertIn(residue['N'], residue['CA'].tags['covalent_bonds'])
+        self.assertEqual(
+            len(bonds), sum(len(a.tags['covalent_bonds']) for a in residue) / 2)
+
+    def test_bond_subgraphs_from_break(self):
+        residue = self.chain[5]
+        graph = generate_covalent_bond_graph(find_covalent_bonds(residue))
+        n_edges = graph.number_of_edges()
+        subgraphs = generate_bond_subgraphs_from_break(
+            graph, residue['CA'], residue['CB'])
+        self.assertEqual(len(subgraphs), 2)
+        self.assertEqual(graph.number_of_edges(), n_edges)
+
+    def test_side_chains(self):
+        for residue in self.chain:
+            side_chain = {a.res_label for a in residue.side_chain}
+            expected = set(residue.atoms.keys()) - {'N', 'CA', 'C', 'O', 'OXT'}
+            self.assertEqual(side_chain, expected)
+
+    def test_incomplete_side_chain(self):
+        residue = next(r for r in self.chain if r.mol_code == 'LYS')
+        del residue.atoms['NZ']
+        self.assertEqual(
+            {a.res_label for a in residue.side_chain}, {'CB', 'CG', 'CD', 'CE'})
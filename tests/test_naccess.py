@@ -0,0 +1,69 @@
+"""Tests basic NACCESS functionality."""
+
+import os
+import pathlib
+import unittest
+
+from ampal.naccess import (
+    extract_residue_accessibility, run_naccess_batch, total_accessibility)
+
+
+TEST_FILE_FOLDER = pathlib.Path(__file__).parent / 'testing_files'
+
+
+RSA_STR = """\
+REM  Relative accessibilites read from external file "standard.data"
+REM  File of summed (Sum) and % (per.) accessibilities for
+REM RES _ NUM      All-atoms   Total-Side   Main-Chain    Non-polar    All polar
+REM                ABS   REL    ABS   REL    ABS   REL    ABS   REL    ABS   REL
+RES MET A   1   197.35 100.1 160.17 100.9  37.18  96.8 141.28 101.4  56.07  97.2
+RES ASP A   2    87.06  61.9  55.11  54.1  31.95  81.4  28.94  76.5  58.12  56.6
+HEM HEM A 201   512.30  88.2 512.30  88.2   0.00   0.0 401.10  90.3 111.20  80.9
+END  Absolute sums over single chains surface
+CHAIN  1 A      796.7        727.6         69.1        571.3        225.4
+END  Absolute sums over all chains
+TOTAL           796.7        727.6         69.1        571.3        225.4
+"""
+
+
+class NaccessParsingTestCase(unittest.TestCase):
+    """Tests for parsing NACCESS rsa files."""
+
+    def test_total_accessibility(self):
+        for rsa in [RSA_STR, RSA_STR.replace('\n', '\r\n')]:
+            self.assertEqual(
+                total_accessibility(rsa, path=False),
+                (796.7, 727.6, 69.1, 571.3, 225.4))
+
+    def test_extract_residue_accessibility(self):
+        for rsa in [RSA_STR, RSA_STR.replace('\n', '\r\n')]:
+            self.assertEqual(
+                extract_residue_accessibility(rsa, path=False),
+                ([100.1, 61.9, 88.2], None))
+            self.assertEqual(
+                extract_residue_accessibility(
+                    rsa, path=False, get_total=True),
+                ([100.1, 61.9, 88.2], 796.7))
+
+
+class NaccessBatchTestCase(unittest.TestCase):
+    """Tests for running naccess on many structures.
+
+    Notes
+    -----
+    Uses a stub in place of naccess that copies its input pdb to the
+    output files.
+    """
+
+    def test_run_naccess_batch(self):
+        pdbs = ['HEADER    STRUCTURE {}\n'.format(i) for i in range(6)]
+        cwd = os.getcwd()
+        naccess_outs = run_naccess_batch(
+            pdbs, 'rsa', path=False, include_hetatms=True,
+            path_to_ex=str(TEST_FILE_FOLDER / 'naccess_stub'), max_workers=2)
+        self.assertEqual(naccess_outs, pdbs)
+        self.assertEqual(os.getcwd(), cwd)
+
+
+if __name__ == '__main__':
+    unittest.main()
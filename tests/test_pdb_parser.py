@@ -1,6 +1,7 @@
 """Tests the PDB parser."""
 
 from collections import Counter
+import locale
 import pathlib
 import unittest
 
@@ -66,3 +67,92 @@ class PdbParserTestCase(unittest.TestCase):
         """Check that 3qy1 has been parsed correctly."""
         test_file_path = str(TEST_FILE_FOLDER / '3qy1.pdb')
         self.check_ampal_contents(test_file_path)
+
+    def test_compiled_line_parser(self):
+        """Check the compiled and Python record parsers agree."""
+        from ampal.pdb_parser import _parse_atom_line, parse_atom_line
+        for pdb_name in ['1ek9.pdb', '2ht0.pdb', '3qy1.pdb']:
+            with open(str(TEST_FILE_FOLDER / pdb_name), 'r') as inf:
+                for line in inf.read().splitlines():
+                    if line.startswith(('ATOM  ', 'HETATM')):
+                        self.assertEqual(
+                            parse_atom_line(line), _parse_atom_line(line))
+        short_line = 'ATOM      1  N   MET A   1      11.104   6.134'
+        with self.assertRaises(ValueError):
+            parse_atom_line(short_line)
+
+    def test_malformed_numeric_fields(self):
+        """Check the compiled and Python parsers agree on odd numbers."""
+        from ampal.pdb_parser import _parse_atom_line, parse_atom_line
+
+        def parse(parser, line):
+            try:
+                return repr(parser(line))
+            except ValueError as error:
+                return str(error)
+
+        line = ('ATOM  {:>5}  N   MET A   1    {:>8}   6.134  -6.504'
+                '  1.00  0.00           N  ')
+        serials = ['1', '+12', '-3', '1_0', '0x1F', '1.0', '-', '']
+        coordinates = [
+            '11.104', '+3.25', '-1.5e2', '1e999', '1_0', 'inf', 'nan',
+            '0x1p3', 'nan(1)', '1,5', '1.0.0', 'e5', '-', '']
+        for serial in serials:
+            for x in coordinates:
+                record = line.format(serial, x)
+                self.assertEqual(
+                    parse(parse_atom_line, record),
+                    parse(_parse_atom_line, record))
+
+    def test_numeric_fields_ignore_locale(self):
+        """Check coordinates parse the same under a comma-decimal locale."""
+        from ampal.pdb_parser import _parse_atom_line, parse_atom_line
+        line = ('ATOM      1  N   MET A   1      11.104   6.134  -6.504'
+                '  1.00  0.00           N  ')
+        original = locale.setlocale(locale.LC_NUMERIC)
+        for name in ['de_DE.UTF-8', 'de_DE.utf8', 'de_DE']:
+            try:
+                locale.setlocale(locale.LC_NUMERIC, name)
+                break
+            except locale.Error:
+                continue
+        else:
+            self.skipTest('No comma-decimal locale available.')
+        try:
+            self.assertEqual(parse_atom_line(line), _parse_atom_line(line))
+        finally:
+            locale.setlocale(locale.LC_NUMERIC, original)
+
+    def test_updated_standard_amino_acids(self):
+        """Check residues added to standard_amino_acids parse as Residues."""
+        line = ('ATOM      1  N   MSE A   1      11.104   6.134  -6.504'
+                '  1.00  0.00           N  ')
+        self.assertIsInstance(
+            ampal.load_pdb(line, path=False)['A']['1'], ampal.Nucleotide)
+        ampal.amino_acids.standard_amino_acids['M'] = 'MSE'
+        try:
+            structure = ampal.load_pdb(line, path=False)
+        finally:
+            ampal.amino_acids.standard_amino_acids['M'] = 'MET'
+        self.assertIsInstance(structure['A']['1'], ampal.Residue)
+
+    def test_non_ascii_segment_id(self):
+        """Check records with non-ASCII text in non-numeric columns parse."""
+        from ampal.pdb_parser import _parse_atom_line, parse_atom_line
+        line = ('ATOM      1  N   MET A   1      11.104   6.134  -6.504'
+                '  1.00  0.00      SEGé N  ')
+        self.assertEqual(parse_atom_line(line), _parse_atom_line(line))
+        structure = ampal.load_pdb(line, path=False)
+        atom = structure['A']['1']['N']
+        self.assertEqual(list(atom._vector), [11.104, 6.134, -6.504])
+
+    def test_chains_out_of_order(self):
+        """Check chains are sorted if they are not in order in the file."""
+        with open(str(TEST_FILE_FOLDER / '1ek9.pdb'), 'r') as inf:
+            atom_lines = [
+                line for line in inf.read().splitlines()
+                if line.startswith('ATOM  ')]
+        chain_a = [line for line in atom_lines if line[21] == 'A']
+        chain_b = [line for line in atom_lines if line[21] == 'B']
+        structure = ampal.load_pdb('\n'.join(chain_b + chain_a), path=False)
+        self.assertEqual([p.id for p in structure], ['A', 'B'])
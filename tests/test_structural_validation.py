@@ -1,3 +1,4 @@
+import copy
 import unittest
 import itertools
 import pathlib
@@ -39,5 +40,60 @@ class PolypeptideStructuralValidationTestCase(unittest.TestCase):
                         for p in self.test_polypeptides]
         self.assertTrue(all(valid_angles))
 
+    def test_backbone_bond_lengths(self):
+        # checks bond lengths against distances between individual atoms.
+        for p in self.test_polypeptides:
+            bond_lengths = p.backbone_bond_lengths
+            self.assertTrue(numpy.allclose(
+                bond_lengths['n_ca'],
+                [ampal.geometry.distance(r['N'], r['CA']) for r in p]))
+            self.assertTrue(numpy.allclose(
+                bond_lengths['c_o'],
+                [ampal.geometry.distance(r['C'], r['O']) for r in p]))
+            self.assertTrue(numpy.allclose(
+                bond_lengths['c_n'],
+                [ampal.geometry.distance(r1['C'], r2['N'])
+                 for r1, r2 in zip(p[:-1], p[1:])]))
+            self.assertEqual(len(bond_lengths['c_n']), len(p) - 1)
+
+    def test_backbone_bond_angles(self):
+        # checks bond angles against angles between individual vectors.
+        for p in self.test_polypeptides:
+            bond_angles = p.backbone_bond_angles
+            self.assertTrue(numpy.allclose(
+                bond_angles['n_ca_c'],
+                [ampal.geometry.angle_between_vectors(
+                    r['N'] - r['CA'], r['C'] - r['CA']) for r in p]))
+            self.assertTrue(numpy.allclose(
+                bond_angles['c_n_ca'],
+                [ampal.geometry.angle_between_vectors(
+                    r1['C'] - r2['N'], r2['CA'] - r2['N'])
+                 for r1, r2 in zip(p[:-1], p[1:])]))
+            self.assertEqual(len(bond_angles['ca_c_n']), len(p) - 1)
+
+    def test_join_torsion_angles(self):
+        # checks joins give the requested torsion angles and valid bonds.
+        p = self.test_polypeptides[0]
+        for join in ['c_join', 'n_join']:
+            start, end = copy.deepcopy(p[:5]), copy.deepcopy(p[10:15])
+            getattr(start, join)(end, psi=120.0, omega=175.0, phi=-60.0)
+            torsion_angles = ampal.analyse_protein.measure_torsion_angles(start)
+            psi = torsion_angles[4][2]
+            omega, phi, _ = torsion_angles[5]
+            self.assertTrue(numpy.allclose(
+                [psi, omega, phi], [120.0, 175.0, -60.0]))
+            self.assertTrue(start.valid_backbone_bond_lengths())
+
+    def test_align(self):
+        # checks align superposes the N, CA and C atoms of the residues.
+        target = self.test_polypeptides[0]
+        mobile = copy.deepcopy(target)
+        mobile.rotate(37.0, [1.0, 2.0, 3.0], point=[4.0, 5.0, 6.0])
+        mobile.translate([3.0, -2.0, 9.0])
+        ampal.protein.align(target, mobile, target_i=3, mobile_i=3)
+        for atom in ['N', 'CA', 'C', 'O']:
+            self.assertTrue(numpy.allclose(
+                mobile[3][atom]._vector, target[3][atom]._vector))
+
 
 __author__ = 'Jack W. Heal'